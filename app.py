@@ -1,6 +1,10 @@
+import hashlib
 import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 import fitz  # PyMuPDF
 from flask import Flask, flash, redirect, render_template, request, url_for
@@ -12,41 +16,255 @@ app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['ALLOWED_EXTENSIONS'] = {'pdf'}
 app.config['SECRET_KEY'] = 'supersecretkey'
+app.config['PARSE_CACHE_SIZE'] = 32  # parsed uploads kept, keyed by file content hash; 0 disables the cache
+
+# Document-format markers used by split_passage_questions, in priority order
+_FORMAT_RE = re.compile(
+    r'(?P<headings>List of Headings\s*\n)|(?P<reading>READING\s+PASSAGE\s+\d+)|(?P<below>below\.)',
+    re.IGNORECASE
+)
+
+# Single-choice MCQ: the question number must start a line (so "boxes 27-32" in
+# instructions is ignored), the prompt is a short non-greedy run (< 300 chars, so
+# Y/N/NG statements are not swallowed) that never crosses a "Questions N" header,
+# and options A-D must each start a line (so words like "a service" don't match).
+# The header check is only attempted at newlines rather than before every character.
+_MCQ_RE = re.compile(
+    r'''
+    (?:^|\n)(\d+)\s+                                  # question number
+    ((?:[^\n]|\n(?!Questions?\s+\d+)){10,300}?)       # prompt
+    \n\s*A\s+(.*?)
+    \n\s*B\s+(.*?)
+    \n\s*C\s+(.*?)
+    \n\s*D\s+(.*?)
+    (?=\n\d+\s+|\nQuestions?\s+\d+|\Z)                # next question, next section or end
+    ''',
+    re.DOTALL | re.MULTILINE | re.VERBOSE
+)
+
+# Question-section parsing patterns
+_WHITESPACE_RE = re.compile(r'\s+')
+_HEADING_RE = re.compile(r'Questions?\s+(\d+)(?:\s*[-\u2013]\s*(\d+))?', re.IGNORECASE)
+_QUESTIONS_START_RE = re.compile(r'Questions?\s+\d+', re.IGNORECASE)
+_NEXT_QUESTIONS_RE = re.compile(r'\n\s*Questions?\s+\d+', re.IGNORECASE)
+_NEXT_QUESTIONS_LINE_RE = re.compile(r'\nQuestions?\s+\d+', re.IGNORECASE)
+_NUMBERED_LINE_RE = re.compile(r'^(\d+)\s+(.+)$')
+_LETTERED_LINE_RE = re.compile(r'^([A-Z])\s+(.+)$')
+_INDENTED_NUMBER_RE = re.compile(r'\s*\d+\s+')
+_NUMBERED_BLANK_RE = re.compile(r'\d+\s*[_]{2,}')
+# Where the passage ends after a "... below." marker: the first of these
+_PASSAGE_END_RE = re.compile(
+    r'Choose the correct letter'
+    r'|Complete the sentences'
+    r'|Complete the summary'
+    r'|Do the following statements agree'
+    r'|Matching'
+    r'|Questions?\s+\d+',
+    re.IGNORECASE
+)
+
+# Passage paragraph letters: a lone "A" line, or "A text" / "A. text" / "A) text"
+_LETTER_ONLY_RE = re.compile(r'^[A-Z]$')
+_INLINE_LETTER_RE = re.compile(r'^(?P<letter>[A-Z])(?:[\.\)]\s*|\s+)(?P<body>.+)$')
+
+# Paragraph matching
+_LETTER_OPTION_TOKEN_RE = re.compile(r'([A-Z])\s*-[\s]*([A-Z])|\b([A-Z])\b')
+_PARAGRAPH_REFERENCE_RE = re.compile(r'(?:paragraphs?|sections?)\s+([A-Z][^.;]*)', re.IGNORECASE)
+_CLAUSE_END_RE = re.compile(r'[.;]')
+_LETTER_SEPARATOR_RE = re.compile(r'[;,\s]+')
+_STATEMENT_START_RE = re.compile(r'^\d{1,2}(?:\s|$)')
+_SECTION_START_RE = re.compile(r'^(Types?|Questions?|Complete|Write|Choose|Match)\b', re.IGNORECASE)
+_WORD_BANK_LINE_RE = re.compile(r'^[A-Z](?:\s{2,}|[):-]\s+)[a-z]')
+_QUESTION_LINE_RE = re.compile(r'^(How|Why|What|When|Where|Which|Who)\b.*\?')
+_SUBSECTION_HEADER_RE = re.compile(r'^[A-Z][a-z]+\s+(of|for|in|on)\s+')
+_ORDINAL_TYPE_RE = re.compile(r'\b(First|Second|Third|Fourth|Fifth)\s+type:\s*', re.IGNORECASE)
+_STEP_MARKER_RE = re.compile(r'\b(Step|Stage|Phase|Part)\s+\d+:\s*', re.IGNORECASE)
+# Any subheading keyword as a whole word/phrase (avoids "reintroduction"); run on lowered text
+_SUBHEADING_KEYWORD_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(keyword) for keyword in SUBHEADING_KEYWORDS) + r')\b'
+)
+
+# Yes/No/Not Given
+_LINE_HEADING_RE = re.compile(
+    r'^[^\S\n]*Questions?[^\S\n]+(\d+)(?:[^\S\n]*[-\u2013][^\S\n]*(\d+))?',
+    re.IGNORECASE | re.MULTILINE
+)
+# Case-insensitive keyword probes; "NOT GIVEN" may be wrapped onto the next line
+_NOT_GIVEN_RE = re.compile(r'NOT\s+GIVEN', re.IGNORECASE)
+_YES_RE = re.compile(r'YES', re.IGNORECASE)
+_TRUE_RE = re.compile(r'TRUE', re.IGNORECASE)
+_YNNG_STATEMENT_RE = re.compile(r'(\d+)\s+(.*?)(?=(?:\n\s*\d+)|\Z)', re.DOTALL)
+_LETTER_OPTION_RE = re.compile(r'^[A-Z](?:[):-]\s+|\s{1,})[A-Za-z]')
+_QUESTION_HEADING_RE = re.compile(
+    r'^(How|Why|What|When|Where|Which|Who|Complete|Choose|Write|Match)\s+',
+    re.IGNORECASE
+)
+
+# Matching headings / features
+_ROMAN_ONLY_RE = re.compile(r'^(i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s*$', re.IGNORECASE)
+_ROMAN_WITH_TEXT_RE = re.compile(r'^(i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s+(.+)$', re.IGNORECASE)
+# Line classifier for matching-headings sections; alternatives are tried in order
+# and the last group of each alternative names the line kind (match.lastgroup)
+_HEADING_LINE_RE = re.compile(
+    r'''
+    (?P<roman_only>i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s*$
+    | (?P<roman_key>i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s+(?P<roman_text>.+)$
+    | (?P<paragraph_number>\d+)\s+(?:Paragraph|Section)\s+(?P<paragraph_letter>[A-Z])$
+    | (?P<number_only>\d+)$
+    | (?:Paragraph|Section)\s+(?P<label_letter>[A-Z])$
+    ''',
+    re.IGNORECASE | re.VERBOSE
+)
+_LIST_OF_HEADINGS_RE = re.compile(r'List of Headings\s*\n', re.IGNORECASE)
+_LIST_OF_NAME_RE = re.compile(r'List of [A-Za-z]+', re.IGNORECASE)
+
+# Section keyword probes, scanned case-insensitively without lower-casing the section
+_HEADING_KEYWORD_RE = re.compile(r'heading', re.IGNORECASE)
+_LIST_OF_KEYWORD_RE = re.compile(r'list of', re.IGNORECASE)
+_MATCH_KEYWORD_RE = re.compile(r'match', re.IGNORECASE)
+_MATCH_INSTRUCTION_RE = re.compile(r'match each|match the|matching', re.IGNORECASE)
+_CLASSIFY_KEYWORD_RE = re.compile(r'classify', re.IGNORECASE)
+_FEATURES_KEYWORD_RE = re.compile(r'list of|match|classify', re.IGNORECASE)  # any features keyword
+_WHICH_PARAGRAPH_RE = re.compile(r'which paragraph', re.IGNORECASE)
+_SENTENCE_ENDING_KEYWORD_RE = re.compile(r'complete|sentence|ending')  # run on the lowered section
+_DIAGRAM_KEYWORD_RE = re.compile(r'diagram|label|figure|illustration', re.IGNORECASE)
+
+# Multi-answer MCQ: "Questions 25 and 26" / "Questions 25, 26 and 27" + "Choose TWO letters"
+_MULTI_ANSWER_HEADING_RE = re.compile(
+    r'Questions?\s+(\d+)(?:\s+and\s+(\d+)|\s*,\s*(\d+)(?:\s+and\s+(\d+))?)',
+    re.IGNORECASE
+)
+_CHOOSE_LETTERS_RE = re.compile(r'Choose\s+(TWO|THREE|FOUR|FIVE)\s+letters?', re.IGNORECASE)
+
+# Summary completion: numbered blanks and word-bank option lines
+_SUMMARY_BLANK_RE = re.compile(r'(?P<num>\d{1,2})\s*[_]{2,}')
+_SUMMARY_OPTION_LINE_RE = re.compile(r'^[A-Z](?:[):-]\s+|\s{2,})\S')  # "A  text" (2 spaces) or "A) text"
+_MULTI_OPTION_LINE_RE = re.compile(r'[A-Z]\s+\w+\s+[A-Z]\s+\w')  # "A America  B Philippines"
+_OPTION_SPLIT_RE = re.compile(r'(?=[A-Z]\s+\w)')
+_OPTION_ENTRY_RE = re.compile(r'^([A-Z])(?:[):-]\s+|\s{1,})\s*(.+)')
+
+# Short answer: "NO MORE THAN X WORDS" and "ONE/TWO/... WORD(S) ONLY"
+_WORD_LIMIT_RE = re.compile(
+    r'(?:using|write|answer|choose)?\s*(?:no more than|maximum of|maximum)\s+(\w+)\s+(?:words?|numbers?)',
+    re.IGNORECASE
+)
+_WORD_ONLY_RE = re.compile(
+    r'(?:choose|write|use)?\s*(one|two|three|four|five)\s+words?\s+only',
+    re.IGNORECASE
+)
+_SHORT_ANSWER_NUMBER_RE = re.compile(r'(?m)^(?P<number>\d{1,2})\s*(?:[).:-])?')
+# Instruction phrases dropped from short-answer lines
+_SHORT_ANSWER_INSTRUCTION_RE = re.compile(
+    r'answer the questions|choose no more than|write your answers'
+    r'|using no more than|use no more than|reading passage',
+    re.IGNORECASE
+)
+_FILL_HEADER_RE = re.compile(r'complete the summary|complete the sentences', re.IGNORECASE)
+
+# Fill-in-the-blank: "14 ______ text", underscore runs and stray question numbers
+_FILL_BLANK_RE = re.compile(
+    r'(?P<num>\d{1,2})\s*(?:[).:-])?\s*(?P<blank>_{2,})(?P<after>[^0-9_]{0,200})',
+    re.DOTALL
+)
+_QUESTIONS_NUMBER_RE = re.compile(r'Questions?\s+\d+', re.IGNORECASE)
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+_SMALL_NUMBER_RE = re.compile(r'\b\d{1,2}\b')
+_SENTENCE_BREAK_RE = re.compile(r'[.;!?]')
+
+
+# Passage lines starting with these (case-insensitively) are exam instructions
+_INSTRUCTION_PREFIXES = ('reading passage', 'you should spend')
+
+
+def starts_with_instruction(value: str) -> bool:
+    """Return True for text starting with 'Reading Passage', 'You should spend' or the word 'Question(s)'."""
+    head = value[:17].lower()
+    if head.startswith(_INSTRUCTION_PREFIXES):
+        return True
+    if not head.startswith('question'):
+        return False
+    # 'Question' or 'Questions' must be a whole word ("Questionnaire" is passage text)
+    tail = head[9:] if head.startswith('questions') else head[8:]
+    return not tail or not (tail[0].isalnum() or tail[0] == '_')
+
+
+def has_number_prefix(value: str) -> bool:
+    """Return True when value starts with digits followed by whitespace (e.g. '14 The ...')."""
+    parts = value.split(None, 1)
+    return len(parts) == 2 and value[:1].isdecimal() and parts[0].isdecimal()
+
+
+class BlockTable(NamedTuple):
+    """Text blocks of a PDF stored as parallel columns (one entry per block)."""
+    text: List[str]
+    text_norm: List[str]
+    page_index: List[int]
+    bbox: List[Any]
+
+
+def as_block_table(blocks: Any) -> BlockTable:
+    """Return blocks as a BlockTable, converting a legacy list of block dicts."""
+    if isinstance(blocks, BlockTable):
+        return blocks
+    table = BlockTable([], [], [], [])
+    for block in blocks or []:
+        text = block.get('text', '')
+        table.text.append(text)
+        table.text_norm.append(normalize_whitespace(text))
+        table.page_index.append(block.get('page_index'))
+        table.bbox.append(block.get('bbox'))
+    return table
 
 
 def allowed_file(filename: str) -> bool:
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
 
 
-def extract_text_and_blocks(filepath: Path) -> Tuple[str, List[Dict[str, Any]]]:
+def extract_text_and_blocks(filepath: Path, data: Optional[bytes] = None) -> Tuple[str, BlockTable]:
+    # data, when given, is the already-read file content and is parsed in memory
     text_chunks: List[str] = []
-    blocks: List[Dict[str, Any]] = []
+    blocks = BlockTable([], [], [], [])
 
-    with fitz.open(filepath) as doc:
+    with (fitz.open(stream=data, filetype='pdf') if data is not None else fitz.open(filepath)) as doc:
         for page_index, page in enumerate(doc):
-            text_chunks.append(page.get_text())
-            page_dict = page.get_text('dict')
+            # One 'dict' pass per page feeds both outputs; the plain-text flags
+            # leave images out, so no image data is decoded
+            page_dict = page.get_text('dict', flags=fitz.TEXTFLAGS_TEXT)
+            page_lines: List[str] = []
             for block in page_dict.get('blocks', []):
                 if block.get('type', 0) != 0:
                     continue
                 lines = block.get('lines')
                 if not lines:
                     continue
-                block_text = ''.join(
-                    span.get('text', '')
+                line_texts = [
+                    ''.join(span.get('text', '') for span in line.get('spans', []))
                     for line in lines
-                    for span in line.get('spans', [])
-                )
+                ]
+                page_lines.extend(line_texts)
+                block_text = ''.join(line_texts)
                 if block_text.strip():
-                    blocks.append({
-                        'page_index': page_index,
-                        'bbox': block.get('bbox'),
-                        'text': block_text
-                    })
+                    blocks.text.append(block_text)
+                    blocks.text_norm.append(normalize_whitespace(block_text))
+                    blocks.page_index.append(page_index)
+                    blocks.bbox.append(block.get('bbox'))
+            # Same as page.get_text(): every text line followed by a newline
+            text_chunks.append(''.join(line + '\n' for line in page_lines))
 
     return '\n'.join(text_chunks), blocks
 
 
+def _locate_format_markers(full_text: str) -> Dict[str, re.Match]:
+    """Return the first match of each document-format marker, found in a single scan."""
+    markers: Dict[str, re.Match] = {}
+    for match in _FORMAT_RE.finditer(full_text):
+        markers.setdefault(match.lastgroup, match)
+        if len(markers) == 3:
+            break
+    return markers
+
+
+@lru_cache(maxsize=32)
 def split_passage_questions(full_text: str) -> Tuple[str, str]:
     """
     Split the full text into passage and questions.
@@ -57,9 +275,10 @@ def split_passage_questions(full_text: str) -> Tuple[str, str]:
     """
     passage = full_text
     questions = ''
+    markers = _locate_format_markers(full_text)
 
     # Check for "List of Headings" pattern - indicates Matching Headings question format
-    list_of_headings_match = re.search(r'List of Headings\s*\n', full_text, re.IGNORECASE)
+    list_of_headings_match = markers.get('headings')
     if list_of_headings_match:
         # After "List of Headings", skip the roman numeral headings to find passage title
         search_start = list_of_headings_match.end()
@@ -80,14 +299,14 @@ def split_passage_questions(full_text: str) -> Tuple[str, str]:
                 continue
             
             # Check if this is a standalone roman numeral (just the numeral, minimal text)
-            standalone_roman_match = re.match(r'^(i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s*$', stripped, re.IGNORECASE)
+            standalone_roman_match = _ROMAN_ONLY_RE.match(stripped)
             if standalone_roman_match:
                 # This is a standalone roman numeral, next line will be its heading text
                 last_line_was_standalone_roman = True
                 continue
             
             # Check if this line has roman numeral with text on same line
-            roman_with_text_match = re.match(r'^(i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s+(.+)$', stripped, re.IGNORECASE)
+            roman_with_text_match = _ROMAN_WITH_TEXT_RE.match(stripped)
             if roman_with_text_match:
                 # This is a heading with roman numeral and text on same line
                 last_line_was_standalone_roman = False
@@ -105,8 +324,8 @@ def split_passage_questions(full_text: str) -> Tuple[str, str]:
                 # - NOT a single letter (A, B, C, etc.)
                 # - NOT starting with a number (like "34" for next question)
                 if (20 <= len(stripped) <= 80 and 
-                    stripped not in ['A', 'B', 'C', 'D', 'E', 'F', 'G'] and
-                    not re.match(r'^\d+', stripped)):
+                    stripped not in ('A', 'B', 'C', 'D', 'E', 'F', 'G') and
+                    not stripped[:1].isdecimal()):
                     # This is likely the passage title
                     passage_start_line = idx
                     in_heading_list = False
@@ -118,12 +337,11 @@ def split_passage_questions(full_text: str) -> Tuple[str, str]:
             
             # Find where questions resume after the passage
             # Look for "Questions \d+" after the passage start
-            passage_text = full_text[passage_start_pos:]
-            next_questions_match = re.search(r'\n\s*Questions?\s+\d+', passage_text, re.IGNORECASE)
+            next_questions_match = _NEXT_QUESTIONS_RE.search(full_text, passage_start_pos)
             
             if next_questions_match:
                 # Passage ends where next questions section starts
-                passage_end_pos = passage_start_pos + next_questions_match.start()
+                passage_end_pos = next_questions_match.start()
                 passage = full_text[passage_start_pos:passage_end_pos]
                 # Questions are before passage + after passage
                 questions_before = full_text[:passage_start_pos]
@@ -138,40 +356,28 @@ def split_passage_questions(full_text: str) -> Tuple[str, str]:
 
     # Check for "READING PASSAGE" header format - common in IELTS materials
     # Pattern: "READING PASSAGE X" -> title -> content -> "Questions"
-    reading_passage_match = re.search(r'READING\s+PASSAGE\s+\d+', full_text, re.IGNORECASE)
+    reading_passage_match = markers.get('reading')
     if reading_passage_match:
         # Start looking after the "READING PASSAGE" header
         search_start = reading_passage_match.end()
         
         # Find the first "Questions \d+" after the header
-        first_questions_match = re.search(r'\n\s*Questions?\s+\d+', full_text[search_start:], re.IGNORECASE)
+        first_questions_match = _NEXT_QUESTIONS_RE.search(full_text, search_start)
         
         if first_questions_match:
             # The passage is from after the header to before the first questions
-            passage_end_pos = search_start + first_questions_match.start()
+            passage_end_pos = first_questions_match.start()
             passage = full_text[search_start:passage_end_pos]
             questions = full_text[passage_end_pos:]
             return passage.strip(), questions.strip()
 
     # Standard pattern: look for "below" keyword
-    passage_start = re.search(r'below\.', full_text, re.IGNORECASE)
+    passage_start = markers.get('below')
     if passage_start:
         passage_start_index = passage_start.end()
-        question_keywords = [
-            'Choose the correct letter',
-            'Complete the sentences',
-            'Complete the summary',
-            'Do the following statements agree',
-            'Matching',
-            r'Questions?\s+\d+'
-        ]
-        question_start_index = -1
-        for keyword in question_keywords:
-            search_result = re.search(keyword, full_text[passage_start_index:], re.IGNORECASE)
-            if search_result:
-                absolute_index = passage_start_index + search_result.start()
-                if question_start_index == -1 or absolute_index < question_start_index:
-                    question_start_index = absolute_index
+        # One scan of the alternation finds the earliest keyword
+        question_start = _PASSAGE_END_RE.search(full_text, passage_start_index)
+        question_start_index = question_start.start() if question_start else -1
         if question_start_index != -1:
             passage = full_text[passage_start_index:question_start_index]
             questions = full_text[question_start_index:]
@@ -186,11 +392,62 @@ def split_passage_questions(full_text: str) -> Tuple[str, str]:
 
 
 def normalize_whitespace(value: str) -> str:
-    return re.sub(r'\s+', ' ', value or '').strip()
+    # str.split() collapses the same whitespace set as \s and trims both ends
+    return ' '.join((value or '').split())
+
+
+def section_spans(matches: List[re.Match], text_length: int) -> List[Tuple[int, int]]:
+    """Pair each match start with the next match start (or text_length for the last one)."""
+    starts = [match.start() for match in matches]
+    return list(zip(starts, starts[1:] + [text_length]))
+
+
+def split_numbered_statements(block: str) -> List[Tuple[str, str]]:
+    """Split a block that starts with a statement number into (number, text) pairs.
+
+    A statement starts on a line beginning with one or two digits and whitespace; a bare
+    number line counts unless it is the last line, and its text starts on the next line.
+    Continuation lines are kept verbatim, joined with newlines.
+    """
+    statements: List[Tuple[str, str]] = []
+    lines = block.split('\n')
+    last_idx = len(lines) - 1
+    number: Optional[str] = None
+    text_lines: List[str] = []
+
+    for line_idx, line in enumerate(lines):
+        if number is not None and not text_lines:
+            # Text after a bare number begins at the next non-blank content
+            content = line.lstrip()
+            if content:
+                text_lines.append(content)
+            continue
+
+        digits = 0
+        while digits < 2 and digits < len(line) and line[digits].isdecimal():
+            digits += 1
+        if digits and (line[digits].isspace() if digits < len(line) else line_idx < last_idx):
+            if number is not None:
+                statements.append((number, '\n'.join(text_lines)))
+            number = line[:digits]
+            remainder = line[digits:].lstrip()
+            text_lines = [remainder] if remainder else []
+        elif number is not None:
+            text_lines.append(line)
 
+    if number is not None:
+        statements.append((number, '\n'.join(text_lines)))
+    return statements
 
-def collect_passage_blocks(passage: str, blocks: Optional[List[Dict[str, Any]]]) -> List[str]:
-    if not passage or not blocks:
+
+def find_question_headings(questions_text: str) -> List[re.Match]:
+    """Return the 'Question(s) N[-M]' heading matches shared by the section parsers."""
+    return list(_HEADING_RE.finditer(questions_text))
+
+
+def collect_passage_blocks(passage: str, blocks: Optional[BlockTable]) -> List[str]:
+    table = as_block_table(blocks)
+    if not passage or not table.text:
         return []
 
     normalized_passage = normalize_whitespace(passage)
@@ -210,15 +467,14 @@ def collect_passage_blocks(passage: str, blocks: Optional[List[Dict[str, Any]]])
         'match the',
         'writing no more than'
     )
+    # Only the leading characters can match a prefix, so only those are lower-cased
+    prefix_length = max(map(len, question_prefixes))
 
-    for block in blocks:
-        raw_text = block.get('text', '')
-        normalized_block = normalize_whitespace(raw_text)
+    for raw_text, normalized_block in zip(table.text, table.text_norm):
         if not normalized_block:
             continue
 
-        lowered = normalized_block.lower()
-        if lowered.startswith(question_prefixes):
+        if normalized_block[:prefix_length].lower().startswith(question_prefixes):
             continue
 
         index = normalized_passage.find(normalized_block, cursor)
@@ -233,8 +489,14 @@ def collect_passage_blocks(passage: str, blocks: Optional[List[Dict[str, Any]]])
     return passage_blocks
 
 
-def collect_question_blocks(question_text: str, blocks: Optional[List[Dict[str, Any]]]) -> List[str]:
-    if not question_text or not blocks:
+def collect_question_blocks(question_text: str, blocks: Optional[BlockTable]) -> List[str]:
+    return [raw_text for raw_text, _ in _locate_question_blocks(question_text, blocks)]
+
+
+def _locate_question_blocks(question_text: str, blocks: Optional[BlockTable]) -> List[Tuple[str, str]]:
+    """Return (stripped text, normalised text) for the blocks that appear, in order, in question_text."""
+    table = as_block_table(blocks)
+    if not question_text or not table.text:
         return []
 
     normalized_questions = normalize_whitespace(question_text)
@@ -242,11 +504,9 @@ def collect_question_blocks(question_text: str, blocks: Optional[List[Dict[str,
         return []
 
     cursor = 0
-    question_blocks: List[str] = []
+    question_blocks: List[Tuple[str, str]] = []
 
-    for block in blocks:
-        raw_text = block.get('text', '')
-        normalized_block = normalize_whitespace(raw_text)
+    for raw_text, normalized_block in zip(table.text, table.text_norm):
         if not normalized_block:
             continue
 
@@ -254,7 +514,7 @@ def collect_question_blocks(question_text: str, blocks: Optional[List[Dict[str,
         if idx == -1:
             continue
 
-        question_blocks.append(raw_text.strip())
+        question_blocks.append((raw_text.strip(), normalized_block))
         cursor = idx + len(normalized_block)
         if cursor >= len(normalized_questions):
             break
@@ -265,16 +525,8 @@ def collect_question_blocks(question_text: str, blocks: Optional[List[Dict[str,
 def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = None) -> Dict[str, Any]:
     """Derive title and paragraph lettering from the reading passage."""
 
-    def index_to_label(idx: int) -> str:
-        label = ''
-        current = idx
-        while current >= 0:
-            current, remainder = divmod(current, 26)
-            label = chr(65 + remainder) + label
-            current -= 1
-        return label
-
-    raw_lines = [line.rstrip('\r') for line in raw_passage.splitlines()]
+    # splitlines() already breaks on '\r', so lines never carry a trailing one
+    raw_lines = raw_passage.splitlines()
 
     def is_instruction_line(value: str) -> bool:
         lowered = value.lower()
@@ -294,7 +546,7 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
         stripped = value.strip()
         if not stripped or is_instruction_line(stripped):
             return False
-        if re.match(r'^[A-Z]$', stripped):
+        if len(stripped) == 1 and 'A' <= stripped <= 'Z':
             return False
         if len(stripped) > 120:
             return False
@@ -327,8 +579,8 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
     paragraphs: List[Dict[str, str]] = []
     intro_text = ''
 
-    source_blocks = passage_blocks[:] if passage_blocks else []
-    source_blocks = [normalize_whitespace(block) for block in source_blocks if normalize_whitespace(block)]
+    # Each block is normalised once; empty results are dropped
+    source_blocks = [block for block in map(normalize_whitespace, passage_blocks or []) if block]
 
     def extract_letter_sections() -> Tuple[List[str], List[Tuple[str, str]]]:
         pre_letter_lines: List[str] = []
@@ -337,10 +589,9 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
         buffer: List[str] = []
         encountered_letter = False
 
-        letter_only_pattern = re.compile(r'^[A-Z]$')
-        inline_letter_pattern = re.compile(r'^(?P<letter>[A-Z])(?:[\.\)]\s*|\s+)(?P<body>.+)$')
-
         def first_alpha_is_upper(text_value: str) -> bool:
+            # str.isalpha() rather than a regex class: [^\W\d_] also matches
+            # non-letter alphanumerics such as '²' or '½'
             for char in text_value:
                 if char.isalpha():
                     return char.isupper()
@@ -361,7 +612,7 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
                     buffer.append('')
                 continue
 
-            inline_match = inline_letter_pattern.match(stripped)
+            inline_match = _INLINE_LETTER_RE.match(stripped)
             if inline_match:
                 letter = inline_match.group('letter')
                 body = inline_match.group('body').strip()
@@ -384,7 +635,7 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
                     pre_letter_lines.append(stripped)
                 continue
 
-            if letter_only_pattern.match(stripped):
+            if _LETTER_ONLY_RE.match(stripped):
                 next_line_text = ''
                 for look_ahead in range(idx + 1, total_lines):
                     candidate = raw_lines[look_ahead].strip()
@@ -413,21 +664,15 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
         flush()
 
         normalized_sections = [
-            (letter, normalize_whitespace(' '.join(lines)))
-            for letter, lines in sections
-            if normalize_whitespace(' '.join(lines))
+            (letter, text)
+            for letter, text in ((letter, normalize_whitespace(' '.join(lines))) for letter, lines in sections)
+            if text
         ]
 
         return pre_letter_lines, normalized_sections if encountered_letter else []
 
     pre_letter, letter_sections = extract_letter_sections()
 
-    instruction_patterns = (
-        re.compile(r'^reading passage', re.IGNORECASE),
-        re.compile(r'^you should spend', re.IGNORECASE),
-        re.compile(r'^questions?\b', re.IGNORECASE),
-    )
-
     def filter_intro_lines(lines: List[str]) -> List[str]:
         filtered: List[str] = []
         for line in lines:
@@ -436,7 +681,7 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
                 continue
             if normalized_line.lower() == normalized_title:
                 continue
-            if any(pattern.match(normalized_line) for pattern in instruction_patterns):
+            if starts_with_instruction(normalized_line):
                 continue
             filtered.append(normalized_line)
         return filtered
@@ -446,8 +691,8 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
             return False
         if len(text_value) > 350:
             return False
-        sentence_endings = re.findall(r'[.!?]', text_value)
-        if len(sentence_endings) > 3:
+        sentence_endings = text_value.count('.') + text_value.count('!') + text_value.count('?')
+        if sentence_endings > 3:
             return False
         return True
 
@@ -471,7 +716,7 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
         source_blocks = [block for block in source_blocks if block.lower() != normalized_title]
         while source_blocks:
             candidate = source_blocks[0]
-            if any(pattern.match(candidate) for pattern in instruction_patterns):
+            if starts_with_instruction(candidate):
                 source_blocks.pop(0)
                 continue
             if looks_like_intro(candidate):
@@ -479,16 +724,18 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
             break
 
         for block in source_blocks:
-            if any(pattern.match(block) for pattern in instruction_patterns):
+            if starts_with_instruction(block):
                 continue
             paragraphs.append({'letter': '', 'text': block})
     else:
-        blocks = re.split(r'(?:\r?\n){2,}', raw_passage)
+        # Blank-line paragraph breaks; pieces left over from runs of 3+ newlines
+        # are whitespace-only and normalize away below
+        blocks = raw_passage.replace('\r\n', '\n').split('\n\n')
         for block in blocks:
             cleaned = normalize_whitespace(block)
             if not cleaned or cleaned.lower() == normalized_title:
                 continue
-            if any(pattern.match(cleaned) for pattern in instruction_patterns):
+            if starts_with_instruction(cleaned):
                 continue
             if not intro_text and looks_like_intro(cleaned):
                 intro_text = cleaned
@@ -507,13 +754,7 @@ def structure_passage(raw_passage: str, passage_blocks: Optional[List[str]] = No
         # Check if this looks like a standalone subheading
         is_subheading = False
         if len(text) < 60:  # Short paragraph
-            text_lower = text.lower()
-            for keyword in SUBHEADING_KEYWORDS:
-                # Use word boundaries to avoid false matches like "reintroduction"
-                # For multi-word keywords, check if the whole phrase exists
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                    is_subheading = True
-                    break
+            is_subheading = _SUBHEADING_KEYWORD_RE.search(text.lower()) is not None
         
         # If it's a subheading and there's a next paragraph, merge them
         if is_subheading and i + 1 < len(paragraphs):
@@ -554,22 +795,14 @@ def parse_single_choice(questions_text: str) -> List[Dict[str, Any]]:
     # Instruction keywords that indicate this is not a real question
     INSTRUCTION_KEYWORDS = ['choose the correct letter', 'write the correct letter', 'boxes']
 
-    # Improved pattern that requires the question number to be at the start of a line
-    # This prevents matching numbers from instruction text like "boxes 27-32"
-    # Allow optional newlines/whitespace after the question number for multi-line prompts
-    # Use non-greedy matching and limit prompt length to avoid matching fill-in-the-blank questions
-    # Stop at next question number OR "Questions" keyword
-    # The prompt should be reasonable length (< 300 chars) to avoid consuming other questions from Y/N/NG sections
-    # Require options A, B, C, D to be at line start to avoid matching words like "a service"
-    pattern = re.compile(
-        r'(?:^|\n)(\d+)\s+((?:(?!\nQuestions?\s+\d+).){10,300}?)\n\s*A\s+(.*?)\n\s*B\s+(.*?)\n\s*C\s+(.*?)\n\s*D\s+(.*?)(?=\n\d+\s+|\nQuestions?\s+\d+|\Z)',
-        re.DOTALL | re.MULTILINE
-    )
+    # Upper-cased ASCII view of the text for the keyword look-backs below; 'replace'
+    # keeps one byte per character so match offsets index it directly
+    questions_upper = questions_text.encode('ascii', 'replace').upper()
 
     questions: List[Dict[str, Any]] = []
-    for match in pattern.finditer(questions_text):
+    for match in _MCQ_RE.finditer(questions_text):
         number = match.group(1)
-        prompt = re.sub(r'\s+', ' ', match.group(2).strip())
+        prompt = _WHITESPACE_RE.sub(' ', match.group(2).strip())
         
         # Skip if prompt is too short (likely not a real question)
         if len(prompt) < 10:
@@ -582,22 +815,22 @@ def parse_single_choice(questions_text: str) -> List[Dict[str, Any]]:
         # Skip if this section is from a Y/N/NG question section
         # Check if the text leading up to this question contains Y/N/NG instructions
         # Look back further (1000 chars) to catch Y/N/NG instructions that might be farther up
-        section_before = questions_text[max(0, match.start()-1000):match.start()]
-        section_before_upper = section_before.upper()
-        if 'YES' in section_before_upper and 'NOT GIVEN' in section_before_upper:
-            last_questions_idx = section_before_upper.rfind('QUESTIONS')
+        before_start = max(0, match.start()-1000)
+        before_end = match.start()
+        if (questions_upper.find(b'YES', before_start, before_end) != -1 and
+                questions_upper.find(b'NOT GIVEN', before_start, before_end) != -1):
+            last_questions_idx = questions_upper.rfind(b'QUESTIONS', before_start, before_end)
             if last_questions_idx != -1:
-                trailing_segment = section_before_upper[last_questions_idx:]
-                if ('CHOOSE THE CORRECT LETTER' not in trailing_segment and
-                    'WRITE THE CORRECT LETTER' not in trailing_segment):
+                if (questions_upper.find(b'CHOOSE THE CORRECT LETTER', last_questions_idx, before_end) == -1 and
+                    questions_upper.find(b'WRITE THE CORRECT LETTER', last_questions_idx, before_end) == -1):
                     # This is likely a Y/N/NG section, skip it
                     continue
         
-        # Find the last sentence of the prompt
-        sentences = re.split(r'(?<=[.?!])\s+', prompt)
-        actual_prompt = sentences[-1] if sentences else ''
+        # Find the last sentence of the prompt (prompt whitespace is already collapsed to single spaces)
+        sentence_break = max(prompt.rfind('. '), prompt.rfind('? '), prompt.rfind('! '))
+        actual_prompt = prompt[sentence_break + 2:] if sentence_break != -1 else prompt
         
-        options = [re.sub(r'\s+', ' ', match.group(i).strip()) for i in range(3, 7) if match.group(i)]
+        options = [_WHITESPACE_RE.sub(' ', match.group(i).strip()) for i in range(3, 7) if match.group(i)]
         
         # Validate options - they should have reasonable length
         if not options or any(len(opt) < 3 for opt in options):
@@ -643,23 +876,14 @@ def parse_multi_answer_mcq(questions_text: str) -> List[Dict[str, Any]]:
     
     questions: List[Dict[str, Any]] = []
     
-    # Pattern to match "Questions X and Y" or "Questions X, Y and Z" etc.
-    # Followed by "Choose TWO/THREE/FOUR letters"
-    heading_pattern = re.compile(
-        r'Questions?\s+(\d+)(?:\s+and\s+(\d+)|\s*,\s*(\d+)(?:\s+and\s+(\d+))?)',
-        re.IGNORECASE
-    )
-    choose_pattern = re.compile(r'Choose\s+(TWO|THREE|FOUR|FIVE)\s+letters?', re.IGNORECASE)
-    
-    matches = list(heading_pattern.finditer(questions_text))
+    # "Questions X and Y" or "Questions X, Y and Z" etc., followed by "Choose TWO/THREE/FOUR letters"
+    matches = list(_MULTI_ANSWER_HEADING_RE.finditer(questions_text))
     
-    for idx, match in enumerate(matches):
-        start_idx = match.start()
-        end_idx = matches[idx + 1].start() if idx + 1 < len(matches) else len(questions_text)
+    for match, (start_idx, end_idx) in zip(matches, section_spans(matches, len(questions_text))):
         section_text = questions_text[start_idx:end_idx].strip()
         
         # Check if this section has "Choose TWO/THREE letters"
-        if not choose_pattern.search(section_text):
+        if not _CHOOSE_LETTERS_RE.search(section_text):
             continue
         
         # Extract question numbers from the heading
@@ -684,7 +908,7 @@ def parse_multi_answer_mcq(questions_text: str) -> List[Dict[str, Any]]:
                 continue
             
             # Check if this is an option line (A  text, B  text, etc.)
-            option_match = re.match(r'^([A-Z])\s+(.+)$', stripped)
+            option_match = _LETTERED_LINE_RE.match(stripped)
             if option_match and len(option_match.group(1)) == 1:
                 in_options = True
                 letter = option_match.group(1)
@@ -695,7 +919,7 @@ def parse_multi_answer_mcq(questions_text: str) -> List[Dict[str, Any]]:
             # If we haven't started options yet, this is part of the prompt
             if not in_options:
                 # Skip instruction lines
-                if not any(kw in stripped.lower() for kw in ['choose', 'write the correct', 'boxes', 'answer sheet']):
+                if not any(kw in stripped.lower() for kw in ('choose', 'write the correct', 'boxes', 'answer sheet')):
                     prompt_lines.append(stripped)
         
         prompt = normalize_whitespace(' '.join(prompt_lines))
@@ -717,8 +941,9 @@ def parse_multi_answer_mcq(questions_text: str) -> List[Dict[str, Any]]:
     return questions
 
 
-def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
-    if not blocks:
+def parse_summary_completion(questions_text: str, blocks: Optional[BlockTable]) -> Optional[Dict[str, Any]]:
+    table = as_block_table(blocks)
+    if not table.text:
         return None
 
     lowered_questions = (questions_text or '').lower()
@@ -731,7 +956,7 @@ def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str
         return None
 
     def normalize(text_value: str) -> str:
-        cleaned = re.sub(r'\s+', ' ', text_value)
+        cleaned = _WHITESPACE_RE.sub(' ', text_value)
         replacements = (
             ('\u2019', "'"),
             ('\u2018', "'"),
@@ -752,48 +977,51 @@ def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str
         lowered = stripped.lower()
         if 'write the correct letter' in lowered or 'choose the correct letter' in lowered:
             return False
-        # Fixed pattern to match "A  text" (2 spaces) as well as "A) text"
-        return bool(re.match(r'^[A-Z](?:[):-]\s+|\s{2,})\S', stripped))
+        return bool(_SUMMARY_OPTION_LINE_RE.match(stripped))
+
+    # The scans below revisit overlapping block ranges, so normalize each block once
+    plain_cache: Dict[int, str] = {}
 
-    blank_pattern = re.compile(r'(?P<num>\d{1,2})\s*[_]{2,}')
+    def plain_at(block_idx: int) -> str:
+        if block_idx not in plain_cache:
+            plain_cache[block_idx] = normalize(table.text[block_idx])
+        return plain_cache[block_idx]
 
     summary_anchor_idx: Optional[int] = None
-    for idx, block in enumerate(blocks):
-        plain_text = normalize(block.get('text', ''))
+    for idx in range(len(table.text)):
+        plain_text = plain_at(idx)
         if not plain_text:
             continue
-        if blank_pattern.search(plain_text):
+        if _SUMMARY_BLANK_RE.search(plain_text):
             summary_anchor_idx = idx
             break
 
     if summary_anchor_idx is None:
         return None
 
-    summary_page = blocks[summary_anchor_idx].get('page_index')
+    summary_page = table.page_index[summary_anchor_idx]
     if summary_page is None:
         return None
 
-    option_lines: List[str] = []
+    # Ordered set of option lines: dict keys keep first-seen order with O(1) membership
+    option_lines: Dict[str, None] = {}
     option_range_start = max(0, summary_anchor_idx - 12)
-    for block in blocks[option_range_start:summary_anchor_idx]:
-        if block.get('page_index') != summary_page:
+    for idx in range(option_range_start, summary_anchor_idx):
+        if table.page_index[idx] != summary_page:
             continue
-        plain = normalize(block.get('text', ''))
+        plain = plain_at(idx)
         if plain and is_option_line(plain):
-            option_lines.append(plain)
+            option_lines[plain] = None
         # Also check for lines with multiple options (e.g., "A America  B Philippines")
-        elif plain and re.search(r'[A-Z]\s+\w+\s+[A-Z]\s+\w', plain):
+        elif plain and _MULTI_OPTION_LINE_RE.search(plain):
             # This line might contain multiple options
-            option_lines.append(plain)
-
-    seen_option_lines = set(option_lines)
+            option_lines[plain] = None
 
     start_idx = summary_anchor_idx
     while start_idx > 0:
-        prev_block = blocks[start_idx - 1]
-        if prev_block.get('page_index') != summary_page:
+        if table.page_index[start_idx - 1] != summary_page:
             break
-        prev_plain = normalize(prev_block.get('text', ''))
+        prev_plain = plain_at(start_idx - 1)
         if not prev_plain:
             start_idx -= 1
             continue
@@ -803,13 +1031,11 @@ def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str
         start_idx -= 1
 
     summary_lines: List[str] = []
-    option_lines_after: List[str] = []
     idx = start_idx
-    while idx < len(blocks):
-        block = blocks[idx]
-        if block.get('page_index') != summary_page:
+    while idx < len(table.text):
+        if table.page_index[idx] != summary_page:
             break
-        plain = normalize(block.get('text', ''))
+        plain = plain_at(idx)
         if not plain:
             idx += 1
             continue
@@ -817,23 +1043,13 @@ def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str
         
         # Check for option lines (single or multiple options per line) - both before and after anchor
         if is_option_line(plain):
-            if plain not in seen_option_lines:
-                if idx < summary_anchor_idx:
-                    option_lines.append(plain)
-                else:
-                    option_lines_after.append(plain)
-                seen_option_lines.add(plain)
+            option_lines[plain] = None
             idx += 1
             continue
             
         # Also check for lines with multiple options
-        if re.search(r'[A-Z]\s+\w+\s+[A-Z]\s+\w', plain):
-            if plain not in seen_option_lines:
-                if idx < summary_anchor_idx:
-                    option_lines.append(plain)
-                else:
-                    option_lines_after.append(plain)
-                seen_option_lines.add(plain)
+        if _MULTI_OPTION_LINE_RE.search(plain):
+            option_lines[plain] = None
             idx += 1
             continue
         
@@ -853,14 +1069,12 @@ def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str
         summary_lines.append(plain)
         idx += 1
 
-    option_lines = list(set(option_lines + option_lines_after))
-
     if not summary_lines:
         return None
 
     first_blank_idx: Optional[int] = None
     for idx, line in enumerate(summary_lines):
-        if blank_pattern.search(line):
+        if _SUMMARY_BLANK_RE.search(line):
             first_blank_idx = idx
             break
 
@@ -879,7 +1093,7 @@ def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str
         blank_numbers.append(number)
         return f'[{number}]'
 
-    display_summary = blank_pattern.sub(blank_replacer, summary_text)
+    display_summary = _SUMMARY_BLANK_RE.sub(blank_replacer, summary_text)
     blank_numbers = list(dict.fromkeys(blank_numbers))
 
     option_entries: List[Dict[str, str]] = []
@@ -888,14 +1102,14 @@ def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str
     for option_line in option_lines:
         # Check if this line contains multiple options (e.g., "A America  B Philippines")
         # Split by pattern: capital letter followed by space and text
-        parts = re.split(r'(?=[A-Z]\s+\w)', option_line.strip())
+        parts = _OPTION_SPLIT_RE.split(option_line.strip())
         
         for part in parts:
             part = part.strip()
             if not part:
                 continue
             # Match pattern like "A  text" or "A) text" or "A: text"
-            option_match = re.match(r'^([A-Z])(?:[):-]\s+|\s{1,})\s*(.+)', part)
+            option_match = _OPTION_ENTRY_RE.match(part)
             if option_match:
                 letter = option_match.group(1)
                 text = option_match.group(2).strip()
@@ -915,12 +1129,11 @@ def parse_summary_completion(questions_text: str, blocks: Optional[List[Dict[str
         'options': option_entries
     }
 
-def parse_paragraph_matching(questions_text: str) -> List[Dict[str, Any]]:
+def parse_paragraph_matching(questions_text: str, heading_matches: Optional[List[re.Match]] = None) -> List[Dict[str, Any]]:
     if not questions_text:
         return []
 
-    heading_pattern = re.compile(r'Questions?\s+(\d+)(?:\s*[-\u2013]\s*(\d+))?', re.IGNORECASE)
-    matches = list(heading_pattern.finditer(questions_text))
+    matches = heading_matches if heading_matches is not None else find_question_headings(questions_text)
     if not matches:
         return []
 
@@ -930,9 +1143,17 @@ def parse_paragraph_matching(questions_text: str) -> List[Dict[str, Any]]:
 
         normalized_text = text_value.replace('\u2013', '-').replace('\u2014', '-').replace('\u2012', '-')
 
-        letters: List[str] = []
+        # Ordered dict used as an insertion-ordered set
+        letters: Dict[str, None] = {}
+        standalone_letters: List[str] = []
 
-        for start_letter, end_letter in re.findall(r'([A-Z])\s*-[\s]*([A-Z])', normalized_text):
+        # One sweep finds both ranges ("A-G") and standalone letters; range letters
+        # are listed first, then any standalone letters not already covered
+        for match in _LETTER_OPTION_TOKEN_RE.finditer(normalized_text):
+            start_letter, end_letter, single_letter = match.groups()
+            if single_letter:
+                standalone_letters.append(single_letter)
+                continue
             start_ord = ord(start_letter)
             end_ord = ord(end_letter)
             if start_ord <= end_ord:
@@ -940,31 +1161,26 @@ def parse_paragraph_matching(questions_text: str) -> List[Dict[str, Any]]:
             else:
                 letter_range = range(start_ord, end_ord - 1, -1)
             for code in letter_range:
-                candidate = chr(code)
-                if candidate not in letters:
-                    letters.append(candidate)
+                letters[chr(code)] = None
 
-        for token in re.findall(r'\b([A-Z])\b', normalized_text):
-            if token not in letters:
-                letters.append(token)
+        for token in standalone_letters:
+            letters[token] = None
 
         if letters:
-            return letters
+            return list(letters)
 
-        for match in re.finditer(r'(?:paragraphs?|sections?)\s+([A-Z][^.;]*)', text_value, re.IGNORECASE):
-            segment = re.split(r'[.;]', match.group(1))[0]
-            for token in re.split(r'[;,\s]+', segment):
+        for match in _PARAGRAPH_REFERENCE_RE.finditer(text_value):
+            segment = _CLAUSE_END_RE.split(match.group(1))[0]
+            for token in _LETTER_SEPARATOR_RE.split(segment):
                 cleaned = token.strip().upper()
-                if len(cleaned) == 1 and cleaned.isalpha() and cleaned not in letters:
-                    letters.append(cleaned)
+                if len(cleaned) == 1 and cleaned.isalpha():
+                    letters[cleaned] = None
 
-        return letters
+        return list(letters)
 
     sections: List[Dict[str, Any]] = []
 
-    for idx, heading in enumerate(matches):
-        start_idx = heading.start()
-        end_idx = matches[idx + 1].start() if idx + 1 < len(matches) else len(questions_text)
+    for start_idx, end_idx in section_spans(matches, len(questions_text)):
         section_text = questions_text[start_idx:end_idx].strip()
         if not section_text:
             continue
@@ -981,14 +1197,14 @@ def parse_paragraph_matching(questions_text: str) -> List[Dict[str, Any]]:
 
         for line in lines:
             raw_line = line.rstrip()
-            stripped = raw_line.strip()
+            stripped = raw_line.lstrip()
             if not stripped:
                 continue
             if not title:
                 title = normalize_whitespace(stripped)
                 continue
             # Match lines that start with a number (with or without following space/text)
-            if re.match(r'^\d{1,2}(?:\s|$)', stripped):
+            if _STATEMENT_START_RE.match(stripped):
                 statement_started = True
             if statement_started:
                 statement_lines.append(raw_line)
@@ -999,12 +1215,13 @@ def parse_paragraph_matching(questions_text: str) -> List[Dict[str, Any]]:
             continue
 
         statements_block = '\n'.join(statement_lines).strip()
-        statement_pattern = re.compile(r'(\d{1,2})\s+(.*?)(?=(?:\n\d{1,2}\s)|\Z)', re.DOTALL)
         statements: List[Dict[str, str]] = []
         seen_numbers = set()
-        for stmt_match in statement_pattern.finditer(statements_block):
-            number = stmt_match.group(1)
-            raw_text = stmt_match.group(2)
+        for number, raw_text in split_numbered_statements(statements_block):
+            # Skip if already seen this number (avoid duplicates from annotations);
+            # checked first so duplicates skip the line filtering entirely
+            if number in seen_numbers:
+                continue
             
             # Filter out contaminating content before processing
             # Split into lines and filter
@@ -1015,26 +1232,26 @@ def parse_paragraph_matching(questions_text: str) -> List[Dict[str, Any]]:
                     continue
                 
                 # Stop processing if we hit a new section (e.g., "Types of homing behaviour", "Questions 23-26")
-                if re.match(r'^(Types?|Questions?|Complete|Write|Choose|Match)\b', line_stripped, re.IGNORECASE):
+                if _SECTION_START_RE.match(line_stripped):
                     break
                     
                 # Skip lines with numbered blanks (summary completion contamination)
-                if re.search(r'\d+\s*[_]{2,}', line_stripped):
+                if _NUMBERED_BLANK_RE.search(line_stripped):
                     continue
                     
                 # Skip lines that look like option definitions (word bank contamination)
                 # Pattern: "A methodology" or "B  needs" (capital letter followed by space(s) and lowercase word)
                 # Avoid false positives like "A typical..." by requiring 2+ spaces OR punctuation before lowercase
-                if re.match(r'^[A-Z](?:\s{2,}|[):-]\s+)[a-z]', line_stripped):
+                if _WORD_BANK_LINE_RE.match(line_stripped):
                     continue
                     
                 # Skip lines that are question headings
-                if re.match(r'^(How|Why|What|When|Where|Which|Who)\b.*\?', line_stripped):
+                if _QUESTION_LINE_RE.match(line_stripped):
                     continue
                     
                 # Skip lines that are section headers (e.g., "Types of homing behaviour")
                 # These often appear in contaminated content
-                if re.match(r'^[A-Z][a-z]+\s+(of|for|in|on)\s+', line_stripped) and len(line_stripped) < 60:
+                if _SUBSECTION_HEADER_RE.match(line_stripped) and len(line_stripped) < 60:
                     continue
                 
                 filtered_lines.append(line_stripped)
@@ -1043,35 +1260,30 @@ def parse_paragraph_matching(questions_text: str) -> List[Dict[str, Any]]:
             
             # Additional cleaning: Remove contaminating patterns from the joined text
             # Remove ordinal list markers like "First type:", "Second type:", "Third type:"
-            text_value = re.sub(r'\b(First|Second|Third|Fourth|Fifth)\s+type:\s*', '', text_value, flags=re.IGNORECASE)
+            text_value = _ORDINAL_TYPE_RE.sub('', text_value)
             
             # Remove other common contaminating section markers
-            text_value = re.sub(r'\b(Step|Stage|Phase|Part)\s+\d+:\s*', '', text_value, flags=re.IGNORECASE)
+            text_value = _STEP_MARKER_RE.sub('', text_value)
             
             # Clean up extra whitespace after removal
             text_value = normalize_whitespace(text_value)
             
-            # Skip if already seen this number (avoid duplicates from annotations)
-            if number in seen_numbers:
-                continue
-            
             # Skip if text is too short (likely an annotation)
             if len(text_value) < 15:
                 continue
             
-            # Skip if text contains mostly non-ASCII characters (likely Chinese annotations)
-            ascii_count = sum(1 for c in text_value if ord(c) < 128)
-            if ascii_count < len(text_value) * 0.5:  # Less than 50% ASCII
+            # Skip if text contains mostly non-ASCII characters (likely Chinese annotations);
+            # pure-ASCII text, the common case, is accepted by isascii() without encoding
+            if not text_value.isascii() and len(text_value.encode('ascii', 'ignore')) * 2 < len(text_value):
                 continue
-            
-            if text_value:
-                statements.append({'number': number, 'text': text_value})
-                seen_numbers.add(number)
+
+            statements.append({'number': number, 'text': text_value})
+            seen_numbers.add(number)
 
         if not statements:
             continue
 
-        instructions_clean = [normalize_whitespace(line) for line in instruction_lines if normalize_whitespace(line)]
+        instructions_clean = [line for line in map(normalize_whitespace, instruction_lines) if line]
         options = extract_paragraph_options(' '.join(instructions_clean))
 
         sections.append({
@@ -1091,8 +1303,6 @@ def parse_yes_no_not_given(questions_text: str) -> List[Dict[str, Any]]:
     if not questions_text:
         return []
 
-    lines = questions_text.splitlines()
-
     def clean(value: str) -> str:
         text_value = value.strip()
         if not text_value:
@@ -1105,36 +1315,26 @@ def parse_yes_no_not_given(questions_text: str) -> List[Dict[str, Any]]:
         )
         for before, after in replacements:
             text_value = text_value.replace(before, after)
-        return re.sub(r'\s+', ' ', text_value)
+        return _WHITESPACE_RE.sub(' ', text_value)
 
     sections: List[Dict[str, Any]] = []
-    i = 0
-    total_lines = len(lines)
+    # Each section runs from a line starting with "Questions N" to the next such line
+    matches = list(_LINE_HEADING_RE.finditer(questions_text))
 
-    while i < total_lines:
-        stripped = lines[i].strip()
-        heading_match = re.match(r'Questions?\s+(\d+)(?:\s*[-\u2013]\s*(\d+))?', stripped, re.IGNORECASE)
-        if not heading_match:
-            i += 1
+    for heading_match, (section_start, section_end) in zip(matches, section_spans(matches, len(questions_text))):
+        if not _NOT_GIVEN_RE.search(questions_text, section_start, section_end):
             continue
-
-        range_start_num = int(heading_match.group(1))
-        range_end_num = heading_match.group(2)
-        range_end_num = int(range_end_num) if range_end_num else None
-
-        j = i + 1
-        section_lines = [lines[i]]
-        while j < total_lines and not re.match(r'Questions?\s+\d+', lines[j].strip(), re.IGNORECASE):
-            section_lines.append(lines[j])
-            j += 1
-
-        section_upper = ' '.join(section_lines).upper()
-        if ('YES' in section_upper and 'NOT GIVEN' in section_upper) or (
-            'TRUE' in section_upper and 'NOT GIVEN' in section_upper
-        ):
+        has_yes = _YES_RE.search(questions_text, section_start, section_end) is not None
+        if has_yes or _TRUE_RE.search(questions_text, section_start, section_end):
+            section_text = questions_text[section_start:section_end]
+            range_start_num = int(heading_match.group(1))
+            range_end_num = heading_match.group(2)
+            range_end_num = int(range_end_num) if range_end_num else None
+
+            section_lines = section_text.splitlines()
             statement_start_idx: Optional[int] = None
             for idx, line in enumerate(section_lines):
-                if re.match(r'\s*\d+\s+', line):
+                if _INDENTED_NUMBER_RE.match(line):
                     statement_start_idx = idx
                     break
 
@@ -1153,11 +1353,6 @@ def parse_yes_no_not_given(questions_text: str) -> List[Dict[str, Any]]:
                 clean_lines = []
                 found_contamination = False
                 
-                # Patterns for detection
-                letter_option_pattern = re.compile(r'^[A-Z](?:[):-]\s+|\s{1,})[A-Za-z]')
-                blank_pattern = re.compile(r'\d+\s*[_]{2,}')
-                question_heading_pattern = re.compile(r'^(How|Why|What|When|Where|Which|Who|Complete|Choose|Write|Match)\s+', re.IGNORECASE)
-                
                 for line in statements_text.split('\n'):
                     stripped_line = line.strip()
                     
@@ -1167,10 +1362,10 @@ def parse_yes_no_not_given(questions_text: str) -> List[Dict[str, Any]]:
                         continue
                     
                     # Stop at contaminating content
-                    if (letter_option_pattern.match(stripped_line) or 
-                        re.match(r'^List of', stripped_line, re.IGNORECASE) or
-                        blank_pattern.search(stripped_line) or
-                        (question_heading_pattern.match(stripped_line) and not re.match(r'^\d+\s+', stripped_line))):
+                    if (_LETTER_OPTION_RE.match(stripped_line) or 
+                        stripped_line[:7].lower() == 'list of' or
+                        _NUMBERED_BLANK_RE.search(stripped_line) or
+                        (_QUESTION_HEADING_RE.match(stripped_line) and not has_number_prefix(stripped_line))):
                         found_contamination = True
                         break
                     
@@ -1178,9 +1373,8 @@ def parse_yes_no_not_given(questions_text: str) -> List[Dict[str, Any]]:
                 
                 statements_text = '\n'.join(clean_lines).strip()
                 
-                statement_pattern = re.compile(r'(\d+)\s+(.*?)(?=(?:\n\s*\d+)|\Z)', re.DOTALL)
                 statements: List[Dict[str, str]] = []
-                for match in statement_pattern.finditer(statements_text):
+                for match in _YNNG_STATEMENT_RE.finditer(statements_text):
                     number = match.group(1)
                     number_int = int(number)
 
@@ -1200,7 +1394,7 @@ def parse_yes_no_not_given(questions_text: str) -> List[Dict[str, Any]]:
                         statements.append({'number': number, 'text': text_value})
 
                 if statements:
-                    options = ['YES', 'NO', 'NOT GIVEN'] if 'YES' in section_upper else ['TRUE', 'FALSE', 'NOT GIVEN']
+                    options = ['YES', 'NO', 'NOT GIVEN'] if has_yes else ['TRUE', 'FALSE', 'NOT GIVEN']
                     sections.append({
                         'type': 'yes_no_not_given',
                         'title': title,
@@ -1209,30 +1403,24 @@ def parse_yes_no_not_given(questions_text: str) -> List[Dict[str, Any]]:
                         'options': options
                     })
 
-        i = j
-
     return sections
 
 
-def parse_matching_headings(questions_text: str) -> List[Dict[str, Any]]:
+def parse_matching_headings(questions_text: str, heading_matches: Optional[List[re.Match]] = None) -> List[Dict[str, Any]]:
     """Parse Matching Headings questions - match roman numeral headings (i, ii, iii) to paragraphs (A, B, C)."""
     if not questions_text:
         return []
 
     sections: List[Dict[str, Any]] = []
-    heading_pattern = re.compile(r'Questions?\s+(\d+)(?:\s*[-\u2013]\s*(\d+))?', re.IGNORECASE)
-    matches = list(heading_pattern.finditer(questions_text))
+    matches = heading_matches if heading_matches is not None else find_question_headings(questions_text)
     
     if not matches:
         return []
 
-    for idx, heading_match in enumerate(matches):
-        start_idx = heading_match.start()
-        end_idx = matches[idx + 1].start() if idx + 1 < len(matches) else len(questions_text)
+    for start_idx, end_idx in section_spans(matches, len(questions_text)):
         section_text = questions_text[start_idx:end_idx].strip()
         
-        lowered = section_text.lower()
-        if 'heading' not in lowered:
+        if not _HEADING_KEYWORD_RE.search(section_text):
             continue
         
         lines = section_text.splitlines()
@@ -1256,19 +1444,22 @@ def parse_matching_headings(questions_text: str) -> List[Dict[str, Any]]:
                 title = normalize_whitespace(stripped)
                 continue
             
+            # One combined match classifies the line; the branches below keep the
+            # original precedence (roman numerals, pending roman text, paragraph refs)
+            line_match = _HEADING_LINE_RE.match(stripped)
+            line_kind = line_match.lastgroup if line_match else None
+
             # Check if this is a standalone roman numeral (no text after it)
-            standalone_roman_match = re.match(r'^(i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s*$', stripped, re.IGNORECASE)
-            if standalone_roman_match:
+            if line_kind == 'roman_only':
                 heading_list_started = True
-                pending_roman = standalone_roman_match.group(1)
+                pending_roman = line_match.group('roman_only')
                 continue
             
             # Check for heading list (i, ii, iii, iv, etc.) with text on same line
-            roman_with_text_match = re.match(r'^(i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s+(.+)$', stripped, re.IGNORECASE)
-            if roman_with_text_match:
+            if line_kind == 'roman_text':
                 heading_list_started = True
-                roman = roman_with_text_match.group(1)
-                text = normalize_whitespace(roman_with_text_match.group(2))
+                roman = line_match.group('roman_key')
+                text = normalize_whitespace(line_match.group('roman_text'))
                 headings.append({'key': roman, 'text': text})
                 pending_roman = None
                 continue
@@ -1281,24 +1472,22 @@ def parse_matching_headings(questions_text: str) -> List[Dict[str, Any]]:
                 continue
             
             # Check for paragraph list (A, B, C, etc.) - allow multiple spaces
-            para_match = re.match(r'^(\d+)\s+(?:Paragraph|Section)\s+([A-Z])$', stripped, re.IGNORECASE)
-            if para_match:
+            if line_kind == 'paragraph_letter':
                 paragraph_list_started = True
-                number = para_match.group(1)
-                letter = para_match.group(2)
+                number = line_match.group('paragraph_number')
+                letter = line_match.group('paragraph_letter')
                 paragraphs.append({'number': number, 'letter': letter})
                 pending_paragraph_number = None
                 continue
 
             # Handle number on its own line followed by "Paragraph X"
-            if re.match(r'^\d+$', stripped):
+            if line_kind == 'number_only':
                 pending_paragraph_number = stripped
                 paragraph_list_started = True
                 continue
 
-            separate_para_match = re.match(r'^(?:Paragraph|Section)\s+([A-Z])$', stripped, re.IGNORECASE)
-            if pending_paragraph_number and separate_para_match:
-                letter = separate_para_match.group(1)
+            if pending_paragraph_number and line_kind == 'label_letter':
+                letter = line_match.group('label_letter')
                 paragraphs.append({'number': pending_paragraph_number, 'letter': letter})
                 pending_paragraph_number = None
                 paragraph_list_started = True
@@ -1310,14 +1499,15 @@ def parse_matching_headings(questions_text: str) -> List[Dict[str, Any]]:
         
         # If we found paragraphs but no headings, look for "List of Headings" elsewhere in the text
         if paragraphs and not headings:
-            # Look for "List of Headings" in the remaining text after this section
-            list_of_headings_match = re.search(r'List of Headings\s*\n', questions_text[end_idx:], re.IGNORECASE)
+            # Look for "List of Headings" in the remaining text after this section;
+            # searches start at an offset so only the heading block itself is sliced
+            list_of_headings_match = _LIST_OF_HEADINGS_RE.search(questions_text, end_idx)
             if list_of_headings_match:
                 # Parse headings from this section
-                heading_section_start = end_idx + list_of_headings_match.end()
+                heading_section_start = list_of_headings_match.end()
                 # Read until next "Questions" section or end of text
-                next_questions_match = re.search(r'\nQuestions?\s+\d+', questions_text[heading_section_start:], re.IGNORECASE)
-                heading_section_end = heading_section_start + (next_questions_match.start() if next_questions_match else 1000)
+                next_questions_match = _NEXT_QUESTIONS_LINE_RE.search(questions_text, heading_section_start)
+                heading_section_end = next_questions_match.start() if next_questions_match else heading_section_start + 1000
                 heading_section_text = questions_text[heading_section_start:heading_section_end]
                 
                 # Parse roman numerals with text
@@ -1326,7 +1516,7 @@ def parse_matching_headings(questions_text: str) -> List[Dict[str, Any]]:
                     stripped = line.strip()
                     if not stripped:
                         continue
-                    roman_match = re.match(r'^(i{1,3}|iv|v|vi{0,3}|ix|x|xi{1,3})\s+(.+)$', stripped, re.IGNORECASE)
+                    roman_match = _ROMAN_WITH_TEXT_RE.match(stripped)
                     if roman_match:
                         roman = roman_match.group(1)
                         text = normalize_whitespace(roman_match.group(2))
@@ -1346,46 +1536,38 @@ def parse_matching_headings(questions_text: str) -> List[Dict[str, Any]]:
     return sections
 
 
-def parse_matching_features(questions_text: str) -> List[Dict[str, Any]]:
+def parse_matching_features(questions_text: str, heading_matches: Optional[List[re.Match]] = None) -> List[Dict[str, Any]]:
     """Parse Matching Features questions - match statements to persons/features/entities."""
     if not questions_text:
         return []
     
     sections: List[Dict[str, Any]] = []
-    heading_pattern = re.compile(r'Questions?\s+(\d+)(?:\s*[-\u2013]\s*(\d+))?', re.IGNORECASE)
-    matches = list(heading_pattern.finditer(questions_text))
+    matches = heading_matches if heading_matches is not None else find_question_headings(questions_text)
     
     if not matches:
         return []
     
-    for idx, heading_match in enumerate(matches):
-        start_idx = heading_match.start()
-        end_idx = matches[idx + 1].start() if idx + 1 < len(matches) else len(questions_text)
+    for idx, (start_idx, end_idx) in enumerate(section_spans(matches, len(questions_text))):
         section_text = questions_text[start_idx:end_idx].strip()
         
-        lowered = section_text.lower()
-        
         # Look for matching features keywords in instruction context (not question text)
         # Check for "List of" which is a strong indicator
-        if 'list of' in lowered:
+        if _LIST_OF_KEYWORD_RE.search(section_text):
             pass  # This is likely a matching features question
         # Check for "match" in instruction context (first few lines), not in question text
-        elif 'match' in lowered:
+        elif _MATCH_KEYWORD_RE.search(section_text):
             # Only consider "match" if it appears in the first 200 characters (instructions)
-            # and is part of instruction phrases like "Match each", "Match the following"
-            instruction_text = section_text[:200].lower()
-            if 'match' not in instruction_text:
-                continue
-            # Also check it's not just "matches" in a question like "which view matches"
-            if not any(phrase in instruction_text for phrase in ['match each', 'match the', 'matching']):
+            # as part of instruction phrases like "Match each", "Match the following",
+            # not just "matches" in a question like "which view matches"
+            if not _MATCH_INSTRUCTION_RE.search(section_text, 0, 200):
                 continue
-        elif 'classify' in lowered:
+        elif _CLASSIFY_KEYWORD_RE.search(section_text):
             pass  # This could be a matching features question
         else:
             continue
         
         # Avoid confusion with paragraph matching
-        if 'which paragraph' in lowered:
+        if _WHICH_PARAGRAPH_RE.search(section_text):
             continue
             
         lines = section_text.splitlines()
@@ -1409,12 +1591,12 @@ def parse_matching_features(questions_text: str) -> List[Dict[str, Any]]:
                 continue
             
             # Check for "List of" header (for reversed order where statements come first)
-            if re.match(r'^List of ', stripped, re.IGNORECASE):
+            if stripped[:8].lower() == 'list of ':
                 in_list_section = True
                 continue
             
             # Check for numbered statements (can appear first in some formats)
-            statement_match = re.match(r'^(\d+)\s+(.+)$', stripped)
+            statement_match = _NUMBERED_LINE_RE.match(stripped)
             if statement_match and not in_list_section:
                 statement_list_started = True
                 number = statement_match.group(1)
@@ -1423,25 +1605,25 @@ def parse_matching_features(questions_text: str) -> List[Dict[str, Any]]:
                 continue
             
             # Check for feature list (A Name1, B Name2, etc.)
-            feature_match = re.match(r'^([A-Z])\s+(.+)$', stripped)
+            feature_match = _LETTERED_LINE_RE.match(stripped)
             if feature_match:
                 letter = feature_match.group(1)
                 name = normalize_whitespace(feature_match.group(2))
-                if len(letter) == 1 and not re.match(r'^\d+', name):
+                if len(letter) == 1 and not name[:1].isdecimal():
                     feature_list_started = True
                     features.append({'key': letter, 'text': name})
                     pending_feature_letter = None
                     continue
 
-            if re.match(r'^[A-Z]$', stripped):
+            if len(stripped) == 1 and 'A' <= stripped <= 'Z':
                 pending_feature_letter = stripped
                 feature_list_started = True
                 continue
 
             if pending_feature_letter and stripped:
-                if not re.match(r'^Questions?\s+\d+', stripped, re.IGNORECASE):
+                if not _QUESTIONS_START_RE.match(stripped):
                     name = normalize_whitespace(stripped)
-                    if name and not re.match(r'^\d+', name):
+                    if name and not name[:1].isdecimal():
                         features.append({'key': pending_feature_letter, 'text': name})
                         feature_list_started = True
                         pending_feature_letter = None
@@ -1454,15 +1636,15 @@ def parse_matching_features(questions_text: str) -> List[Dict[str, Any]]:
         # If we have statements but no features, look for the feature list in subsequent sections
         # This handles cases like PDF84 where the list appears after other questions
         if statements and not features and idx + 1 < len(matches):
-            # Search for "List of" in the text after this section
-            search_text = questions_text[end_idx:]
-            list_match = re.search(r'List of [A-Za-z]+', search_text, re.IGNORECASE)
+            # Search for "List of" in the text after this section; both searches
+            # scan questions_text in place from an offset instead of slicing it
+            list_match = _LIST_OF_NAME_RE.search(questions_text, end_idx)
             if list_match:
                 # Extract features from the list section
-                list_start = end_idx + list_match.end()
+                list_start = list_match.end()
                 # Read until next "Questions" section or end
-                next_q_match = re.search(r'\n\s*Questions?\s+\d+', search_text[list_match.end():], re.IGNORECASE)
-                list_end = list_start + (next_q_match.start() if next_q_match else 500)
+                next_q_match = _NEXT_QUESTIONS_RE.search(questions_text, list_start)
+                list_end = next_q_match.start() if next_q_match else list_start + 500
                 list_text = questions_text[list_start:list_end]
                 
                 # Parse features from this section
@@ -1471,20 +1653,20 @@ def parse_matching_features(questions_text: str) -> List[Dict[str, Any]]:
                     stripped = line.strip()
                     if not stripped:
                         continue
-                    feature_match = re.match(r'^([A-Z])\s+(.+)$', stripped)
+                    feature_match = _LETTERED_LINE_RE.match(stripped)
                     if feature_match:
                         letter = feature_match.group(1)
                         name = normalize_whitespace(feature_match.group(2))
-                        if len(letter) == 1 and not re.match(r'^\d+', name):
+                        if len(letter) == 1 and not name[:1].isdecimal():
                             features.append({'key': letter, 'text': name})
                             pending_letter = None
                         continue
-                    if re.match(r'^[A-Z]$', stripped):
+                    if len(stripped) == 1 and 'A' <= stripped <= 'Z':
                         pending_letter = stripped
                         continue
                     if pending_letter:
                         name = normalize_whitespace(stripped)
-                        if name and not re.match(r'^\d+', name):
+                        if name and not name[:1].isdecimal():
                             features.append({'key': pending_letter, 'text': name})
                             pending_letter = None
         
@@ -1502,21 +1684,18 @@ def parse_matching_features(questions_text: str) -> List[Dict[str, Any]]:
     return sections
 
 
-def parse_matching_sentence_endings(questions_text: str) -> List[Dict[str, Any]]:
+def parse_matching_sentence_endings(questions_text: str, heading_matches: Optional[List[re.Match]] = None) -> List[Dict[str, Any]]:
     """Parse Matching Sentence Endings questions - complete sentences by matching beginnings to endings."""
     if not questions_text:
         return []
     
     sections: List[Dict[str, Any]] = []
-    heading_pattern = re.compile(r'Questions?\s+(\d+)(?:\s*[-\u2013]\s*(\d+))?', re.IGNORECASE)
-    matches = list(heading_pattern.finditer(questions_text))
+    matches = heading_matches if heading_matches is not None else find_question_headings(questions_text)
     
     if not matches:
         return []
     
-    for idx, heading_match in enumerate(matches):
-        start_idx = heading_match.start()
-        end_idx = matches[idx + 1].start() if idx + 1 < len(matches) else len(questions_text)
+    for start_idx, end_idx in section_spans(matches, len(questions_text)):
         section_text = questions_text[start_idx:end_idx].strip()
         
         lowered = section_text.lower()
@@ -1530,7 +1709,7 @@ def parse_matching_sentence_endings(questions_text: str) -> List[Dict[str, Any]]
             continue
         
         # Look for sentence ending keywords
-        if not any(keyword in lowered for keyword in ['complete', 'sentence', 'ending']):
+        if not _SENTENCE_ENDING_KEYWORD_RE.search(lowered):
             continue
         
         lines = section_text.splitlines()
@@ -1552,7 +1731,7 @@ def parse_matching_sentence_endings(questions_text: str) -> List[Dict[str, Any]]
                 continue
             
             # Check for sentence beginnings (numbered)
-            beginning_match = re.match(r'^(\d+)\s+(.+)$', stripped)
+            beginning_match = _NUMBERED_LINE_RE.match(stripped)
             if beginning_match and not endings_started:
                 beginnings_started = True
                 number = beginning_match.group(1)
@@ -1561,7 +1740,7 @@ def parse_matching_sentence_endings(questions_text: str) -> List[Dict[str, Any]]
                 continue
             
             # Check for endings (lettered)
-            ending_match = re.match(r'^([A-Z])\s+(.+)$', stripped)
+            ending_match = _LETTERED_LINE_RE.match(stripped)
             if ending_match and beginnings_started:
                 endings_started = True
                 letter = ending_match.group(1)
@@ -1588,26 +1767,22 @@ def parse_matching_sentence_endings(questions_text: str) -> List[Dict[str, Any]]
     return sections
 
 
-def parse_diagram_label_completion(questions_text: str) -> List[Dict[str, Any]]:
+def parse_diagram_label_completion(questions_text: str, heading_matches: Optional[List[re.Match]] = None) -> List[Dict[str, Any]]:
     """Parse Diagram Label Completion questions - label diagram with words from passage."""
     if not questions_text:
         return []
     
     sections: List[Dict[str, Any]] = []
-    heading_pattern = re.compile(r'Questions?\s+(\d+)(?:\s*[-\u2013]\s*(\d+))?', re.IGNORECASE)
-    matches = list(heading_pattern.finditer(questions_text))
+    matches = heading_matches if heading_matches is not None else find_question_headings(questions_text)
     
     if not matches:
         return []
     
-    for idx, heading_match in enumerate(matches):
-        start_idx = heading_match.start()
-        end_idx = matches[idx + 1].start() if idx + 1 < len(matches) else len(questions_text)
+    for start_idx, end_idx in section_spans(matches, len(questions_text)):
         section_text = questions_text[start_idx:end_idx].strip()
         
-        lowered = section_text.lower()
         # Look for diagram/label keywords
-        if not any(keyword in lowered for keyword in ['diagram', 'label', 'figure', 'illustration']):
+        if not _DIAGRAM_KEYWORD_RE.search(section_text):
             continue
         
         lines = section_text.splitlines()
@@ -1625,7 +1800,7 @@ def parse_diagram_label_completion(questions_text: str) -> List[Dict[str, Any]]:
                 continue
             
             # Check for label items (numbered)
-            label_match = re.match(r'^(\d+)\s+(.+)$', stripped)
+            label_match = _NUMBERED_LINE_RE.match(stripped)
             if label_match:
                 number = label_match.group(1)
                 text = normalize_whitespace(label_match.group(2))
@@ -1651,7 +1826,7 @@ def parse_diagram_label_completion(questions_text: str) -> List[Dict[str, Any]]:
     return sections
 
 
-def parse_short_answer_questions(questions_text: str) -> List[Dict[str, Any]]:
+def parse_short_answer_questions(questions_text: str, heading_matches: Optional[List[re.Match]] = None) -> List[Dict[str, Any]]:
     """
     Parse Short-Answer Questions - answer using NO MORE THAN X WORDS or ONE/TWO/THREE WORD(S) ONLY.
     This handles sentence completion questions (with blanks) that have word limits.
@@ -1665,79 +1840,54 @@ def parse_short_answer_questions(questions_text: str) -> List[Dict[str, Any]]:
     # Look for word limit patterns:
     # 1. "NO MORE THAN X WORDS"
     # 2. "ONE WORD ONLY", "TWO WORDS ONLY", etc.
-    word_limit_pattern = re.compile(
-        r'(?:using|write|answer|choose)?\s*(?:no more than|maximum of|maximum)\s+(\w+)\s+(?:words?|numbers?)',
-        re.IGNORECASE
-    )
-    word_only_pattern = re.compile(
-        r'(?:choose|write|use)?\s*(one|two|three|four|five)\s+words?\s+only',
-        re.IGNORECASE
-    )
-    
-    # Check for either pattern
-    word_limit_match = word_limit_pattern.search(questions_text)
-    word_only_match = word_only_pattern.search(questions_text)
-    
-    if not word_limit_match and not word_only_match:
-        return []
-    
-    # Extract word limit
+    # The "WORD(S) ONLY" form wins, so the other pattern is only searched as a fallback
+    word_only_match = _WORD_ONLY_RE.search(questions_text)
     if word_only_match:
         word_limit = word_only_match.group(1).upper()
     else:
-        word_limit = word_limit_match.group(1) if word_limit_match else 'THREE'
+        word_limit_match = _WORD_LIMIT_RE.search(questions_text)
+        if not word_limit_match:
+            return []
+        word_limit = word_limit_match.group(1)
     
     # Find the section that contains short answer questions
-    heading_pattern = re.compile(r'Questions?\s+(\d+)(?:\s*[-\u2013]\s*(\d+))?', re.IGNORECASE)
-    matches = list(heading_pattern.finditer(questions_text))
+    matches = heading_matches if heading_matches is not None else find_question_headings(questions_text)
     
     if not matches:
         return []
     
-    instruction_markers = (
-        'answer the questions',
-        'choose no more than',
-        'write your answers',
-        'using no more than',
-        'use no more than',
-        'reading passage'
-    )
-
-    for idx, heading_match in enumerate(matches):
-        start_idx = heading_match.start()
-        end_idx = matches[idx + 1].start() if idx + 1 < len(matches) else len(questions_text)
+    for start_idx, end_idx in section_spans(matches, len(questions_text)):
         section_text = questions_text[start_idx:end_idx].strip()
 
         # Skip sections that are summary/note completion (handled by parse_summary_completion)
         section_lower = section_text.lower()
-        if any(marker in section_lower for marker in ['complete the summary', 'complete the notes', 'complete the note', 'complete the table', 'complete the flow']):
+        if any(marker in section_lower for marker in ('complete the summary', 'complete the notes', 'complete the note', 'complete the table', 'complete the flow')):
             continue
 
-        # Check if this section has word limit instructions (either pattern)
-        if not word_limit_pattern.search(section_text) and not word_only_pattern.search(section_text):
+        # Check if this section has word limit instructions (either pattern); the
+        # substring probes let sections without the keywords skip the regexes
+        has_word_limit = (
+            ('no more than' in section_lower or 'max' in section_lower)
+            and _WORD_LIMIT_RE.search(section_text)
+        ) or ('only' in section_lower and _WORD_ONLY_RE.search(section_text))
+        if not has_word_limit:
             continue
 
-        question_number_pattern = re.compile(r'(?m)^(?P<number>\d{1,2})\s*(?:[).:-])?')
-        number_matches = list(question_number_pattern.finditer(section_text))
+        number_matches = list(_SHORT_ANSWER_NUMBER_RE.finditer(section_text))
+
+        # Each question's content runs from its number to the next number's start
+        content_ends = [match.start() for match in number_matches[1:]] + [len(section_text)]
 
-        for q_idx, match in enumerate(number_matches):
+        for match, content_end in zip(number_matches, content_ends):
             number = match.group('number')
-            content_start = match.end()
-            content_end = number_matches[q_idx + 1].start() if q_idx + 1 < len(number_matches) else len(section_text)
-            raw_chunk = section_text[content_start:content_end]
-
-            # Break chunk into lines and filter out instructional text
-            chunk_lines = []
-            for line in raw_chunk.splitlines():
-                cleaned_line = normalize_whitespace(line)
-                if not cleaned_line:
-                    continue
-                lowered_line = cleaned_line.lower()
-                if any(marker in lowered_line for marker in instruction_markers):
-                    continue
-                chunk_lines.append(cleaned_line)
+            raw_chunk = section_text[match.end():content_end]
 
-            text = normalize_whitespace(' '.join(chunk_lines))
+            # Break chunk into lines and filter out instructional text; the kept lines
+            # are already normalised, so joining them needs no further clean-up
+            text = ' '.join(
+                line for line in map(normalize_whitespace, raw_chunk.splitlines())
+                if line and not _SHORT_ANSWER_INSTRUCTION_RE.search(line)
+            )
 
             if not text:
                 continue
@@ -1754,308 +1904,309 @@ def parse_short_answer_questions(questions_text: str) -> List[Dict[str, Any]]:
     return questions
 
 
-def parse_questions(questions_text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
-    questions: List[Dict[str, Any]] = []
-    consumed_numbers: set[str] = set()
-    consumed_ranges: List[Tuple[int, int]] = []
-    question_blocks = collect_question_blocks(questions_text, blocks)
-
-    def parse_number(value: Any) -> Optional[int]:
-        if isinstance(value, int):
-            return value
-        if isinstance(value, str):
-            stripped = value.strip()
-            if stripped.isdigit():
-                return int(stripped)
-        return None
+# Fill-in-blank context is cut after the last of each of these (lowered) phrases, in turn
+_FILL_INSTRUCTION_MARKERS = (
+    'complete the summary',
+    'complete the sentences',
+    'write your answers'
+)
 
-    def collect_section_numbers(entry: Dict[str, Any]) -> List[int]:
-        numbers: List[int] = []
 
-        def add(value: Any) -> None:
-            number = parse_number(value)
-            if number is not None:
-                numbers.append(number)
+def strip_instruction_text(value: str) -> str:
+    lowered = value.lower()
+    for marker in _FILL_INSTRUCTION_MARKERS:
+        idx = lowered.rfind(marker)
+        if idx != -1:
+            value = value[idx + len(marker):]
+            lowered = value.lower()
+    return value.strip()
 
-        add(entry.get('number'))
 
-        for blank in entry.get('blanks', []):
-            add(blank)
+def parse_fill_in_blanks(
+    text: str,
+    block_texts: List[str],
+    normalized_texts: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """Parse fill-in-the-blank questions (Complete the sentences / Complete the summary style).
 
-        nested_keys = (
-            'statements',
-            'paragraphs',
-            'sentence_beginnings',
-            'labels',
-            'questions'
-        )
+    normalized_texts, when given, holds normalize_whitespace() of each block text so the
+    blocks are not normalised again.
+    """
+    results: List[Dict[str, Any]] = []
+    if not text:
+        return results
 
-        for key in nested_keys:
-            items = entry.get(key, [])
-            if not isinstance(items, list):
+    candidate_blocks: List[str] = []
+
+    if block_texts:
+        found_header = False
+        if normalized_texts is None:
+            normalized_texts = [normalize_whitespace(block_text) for block_text in block_texts]
+        for block_text, normalized_block in zip(block_texts, normalized_texts):
+            if not normalized_block:
                 continue
-            for item in items:
-                if isinstance(item, dict):
-                    add(item.get('number'))
-                else:
-                    add(item)
+            if not found_header and _FILL_HEADER_RE.search(normalized_block):
+                found_header = True
 
-        return numbers
+            if not found_header:
+                continue
 
-    def is_consumed(start: int, end: int) -> bool:
-        if start < 0 or end < 0:
-            return False
-        for r_start, r_end in consumed_ranges:
-            if max(start, r_start) < min(end, r_end):
-                return True
-        return False
+            candidate_blocks.append(block_text)
 
-    # Parse summary completion (has blanks with word bank)
-    summary = parse_summary_completion(questions_text, blocks)
-    if summary:
-        questions.append(summary)
-        consumed_numbers.update(summary['blanks'])
+            if _QUESTIONS_NUMBER_RE.search(normalized_block):
+                break
 
-    # Parse matching headings (roman numerals to paragraphs)
-    matching_heading_sections = parse_matching_headings(questions_text)
-    for section in matching_heading_sections:
-        start = section.get('match_start', -1)
-        end = section.get('match_end', -1)
-        if is_consumed(start, end):
-            continue
-        if section.get('paragraphs'):
-            section_numbers = {p['number'] for p in section['paragraphs']}
-            if section_numbers & consumed_numbers:
-                continue
-            consumed_numbers.update(section_numbers)
-        questions.append(section)
-        if start >= 0 and end >= 0:
-            consumed_ranges.append((start, end))
-
-    # Parse paragraph matching (which paragraph contains information)
-    paragraph_sections = parse_paragraph_matching(questions_text)
-    for section in paragraph_sections:
-        start = section.get('match_start', -1)
-        end = section.get('match_end', -1)
-        if is_consumed(start, end):
-            continue
-        section_numbers = {statement['number'] for statement in section['statements']}
-        if section_numbers & consumed_numbers:
-            continue
-        questions.append(section)
-        consumed_numbers.update(section_numbers)
-        if start >= 0 and end >= 0:
-            consumed_ranges.append((start, end))
-
-    # Parse matching features (match statements to persons/features)
-    matching_feature_sections = parse_matching_features(questions_text)
-    for section in matching_feature_sections:
-        start = section.get('match_start', -1)
-        end = section.get('match_end', -1)
-        if is_consumed(start, end):
+    segment_text = '\n'.join(candidate_blocks) if candidate_blocks else text
+    # Keep only the text before the next "Questions N" heading
+    next_heading = _QUESTIONS_NUMBER_RE.search(segment_text)
+    if next_heading:
+        segment_text = segment_text[:next_heading.start()]
+
+    seen_numbers: set[str] = set()
+
+    for match in _FILL_BLANK_RE.finditer(segment_text):
+        num = match.group('num')
+        if num in seen_numbers:
             continue
-        section_numbers = {statement['number'] for statement in section['statements']}
-        if section_numbers & consumed_numbers:
+        start_idx = match.start('num')
+
+        prefix_chunk = segment_text[max(0, start_idx - 200):start_idx]
+        prefix_clean = _UNDERSCORE_RUN_RE.sub(' ', prefix_chunk)
+        prefix_clean = normalize_whitespace(prefix_clean)
+        prefix_clean = strip_instruction_text(prefix_clean)
+        # prefix_clean is already whitespace-normalised, so a bounded split from the
+        # right yields the last eight words without splitting the whole window
+        prefix = ' '.join(prefix_clean.rsplit(None, 8)[-8:])
+        if prefix:
+            prefix = _SMALL_NUMBER_RE.sub('', prefix)
+            # Keep the text after the last sentence break
+            sentence_break = max(prefix.rfind(mark) for mark in '.;!?')
+            prefix = prefix[sentence_break + 1:].strip()
+            prefix = normalize_whitespace(prefix)
+
+        suffix_raw = match.group('after') or ''
+        suffix_raw_stripped = suffix_raw.lstrip()
+        post_blank_punct = ''
+        if suffix_raw_stripped and suffix_raw_stripped[0] in '.;,!?':
+            post_blank_punct = suffix_raw_stripped[0]
+            suffix_raw_stripped = suffix_raw_stripped[1:]
+
+        suffix_clean = _UNDERSCORE_RUN_RE.sub(' ', suffix_raw_stripped)
+        suffix_clean = normalize_whitespace(suffix_clean)
+        suffix_clean = strip_instruction_text(suffix_clean)
+        suffix = ' '.join(suffix_clean.split(None, 8)[:8])
+        if suffix:
+            suffix = _SMALL_NUMBER_RE.sub('', suffix)
+            # Keep the text before the first sentence break
+            sentence_break = _SENTENCE_BREAK_RE.search(suffix)
+            if sentence_break:
+                suffix = suffix[:sentence_break.start()]
+            suffix = suffix.strip()
+            suffix = normalize_whitespace(suffix)
+
+        snippet_parts: List[str] = []
+        if prefix:
+            snippet_parts.append(prefix)
+
+        blank_repr = '____'
+        if post_blank_punct:
+            blank_repr = f'____{post_blank_punct}'
+        snippet_parts.append(blank_repr)
+
+        append_suffix = bool(suffix)
+        if append_suffix and post_blank_punct and suffix and suffix[0].isalpha() and suffix[0].isupper():
+            append_suffix = False
+
+        if append_suffix:
+            snippet_parts.append(suffix)
+
+        snippet = ' '.join(snippet_parts).strip()
+        snippet = snippet.strip('-:;,')
+
+        lowered_snippet = snippet.lower()
+        if not snippet or 'write your answers' in lowered_snippet or 'complete the summary' in lowered_snippet:
             continue
-        questions.append(section)
-        consumed_numbers.update(section_numbers)
-        if start >= 0 and end >= 0:
-            consumed_ranges.append((start, end))
-
-    # Parse matching sentence endings
-    sentence_ending_sections = parse_matching_sentence_endings(questions_text)
-    for section in sentence_ending_sections:
-        start = section.get('match_start', -1)
-        end = section.get('match_end', -1)
-        if is_consumed(start, end):
-            continue
-        section_numbers = {sb['number'] for sb in section['sentence_beginnings']}
-        if section_numbers & consumed_numbers:
+
+        results.append({'type': 'fill_blank', 'number': num, 'text': snippet, 'match_start': match.start(), 'match_end': match.end()})
+        seen_numbers.add(num)
+
+    if results:
+        return results
+
+    # Fallback: basic chunking if underscore matching fails
+    number_matches = list(_SMALL_NUMBER_RE.finditer(segment_text))
+    for idx, nm in enumerate(number_matches):
+        num = nm.group()
+        if num in seen_numbers:
             continue
-        questions.append(section)
-        consumed_numbers.update(section_numbers)
-        if start >= 0 and end >= 0:
-            consumed_ranges.append((start, end))
-
-    # Parse diagram label completion
-    diagram_sections = parse_diagram_label_completion(questions_text)
-    for section in diagram_sections:
-        start = section.get('match_start', -1)
-        end = section.get('match_end', -1)
-        if is_consumed(start, end):
+
+        start = nm.end()
+        end = number_matches[idx + 1].start() if idx + 1 < len(number_matches) else len(segment_text)
+        chunk = segment_text[start:end]
+        if '_' not in chunk:
             continue
-        section_numbers = {label['number'] for label in section['labels']}
-        if section_numbers & consumed_numbers:
+
+        cleaned = normalize_whitespace(chunk)
+        if not cleaned:
             continue
-        questions.append(section)
-        consumed_numbers.update(section_numbers)
-        if start >= 0 and end >= 0:
-            consumed_ranges.append((start, end))
 
-    # Parse short answer questions
-    short_answer_qs = parse_short_answer_questions(questions_text)
-    for q in short_answer_qs:
-        start = q.get('match_start', -1)
-        end = q.get('match_end', -1)
-        if q['number'] in consumed_numbers or is_consumed(start, end):
+        results.append({'type': 'fill_blank', 'number': num, 'text': cleaned, 'match_start': nm.start(), 'match_end': end})
+        seen_numbers.add(num)
+
+    return results
+
+
+def parse_number(value: Any) -> Optional[int]:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped.isdigit():
+            return int(stripped)
+    return None
+
+
+# Entry keys whose items (dicts with a 'number', or bare values) carry question numbers
+_SECTION_NUMBER_KEYS = (
+    'statements',
+    'paragraphs',
+    'sentence_beginnings',
+    'labels',
+    'questions'
+)
+
+
+def _section_number_values(entry: Dict[str, Any]) -> Iterator[Any]:
+    yield entry.get('number')
+    yield from entry.get('blanks', ())
+    for key in _SECTION_NUMBER_KEYS:
+        # Missing keys come back as None and fail the list check; no default list is built
+        items = entry.get(key)
+        if not isinstance(items, list):
             continue
-        questions.append(q)
-        consumed_numbers.add(q['number'])
-        if start >= 0 and end >= 0:
-            consumed_ranges.append((start, end))
-
-    # Parse fill-in-the-blank (Complete the sentences / Complete the summary style)
-    def parse_fill_in_blanks(text: str, block_texts: List[str]) -> List[Dict[str, Any]]:
-        results: List[Dict[str, Any]] = []
-        if not text:
-            return results
-
-        candidate_blocks: List[str] = []
-        lowered_phrases = ('complete the summary', 'complete the sentences')
-
-        if block_texts:
-            found_header = False
-            for block_text in block_texts:
-                normalized_block = normalize_whitespace(block_text)
-                if not normalized_block:
-                    continue
-                lowered = normalized_block.lower()
-                if not found_header and any(phrase in lowered for phrase in lowered_phrases):
-                    found_header = True
+        for item in items:
+            yield item.get('number') if isinstance(item, dict) else item
 
-                if not found_header:
-                    continue
 
-                candidate_blocks.append(block_text)
+def iter_section_numbers(entry: Dict[str, Any]) -> Iterator[int]:
+    """Yield every question number a parsed question or section covers."""
+    for value in _section_number_values(entry):
+        number = parse_number(value)
+        if number is not None:
+            yield number
 
-                if re.search(r'questions?\s+\d+', lowered, re.IGNORECASE):
-                    break
 
-        segment_text = '\n'.join(candidate_blocks) if candidate_blocks else text
-        segment_text = re.split(r'Questions?\s+\d+', segment_text, maxsplit=1, flags=re.IGNORECASE)[0]
+# Section parsers run by parse_questions in priority order: (parser, key of the items
+# carrying question numbers, keyword that must appear in the text or None)
+_SECTION_PARSERS = (
+    (parse_matching_headings, 'paragraphs', _HEADING_KEYWORD_RE),
+    (parse_paragraph_matching, 'statements', None),
+    (parse_matching_features, 'statements', _FEATURES_KEYWORD_RE),
+    (parse_matching_sentence_endings, 'sentence_beginnings', None),
+    (parse_diagram_label_completion, 'labels', _DIAGRAM_KEYWORD_RE),
+)
 
-        pattern = re.compile(
-            r'(?P<num>\d{1,2})\s*(?:[).:-])?\s*(?P<blank>_{2,})(?P<after>[^0-9_]{0,200})',
-            re.DOTALL
-        )
 
-        instruction_markers = (
-            'complete the summary',
-            'complete the sentences',
-            'write your answers'
-        )
+def parse_questions(questions_text: str, blocks: Optional[BlockTable] = None) -> List[Dict[str, Any]]:
+    # Every parser keys off text in questions_text, so blank input cannot yield questions
+    if not questions_text or questions_text.isspace():
+        return []
 
-        def strip_instruction_text(value: str) -> str:
-            lowered = value.lower()
-            for marker in instruction_markers:
-                idx = lowered.rfind(marker)
-                if idx != -1:
-                    value = value[idx + len(marker):]
-                    lowered = value.lower()
-            return value.strip()
-
-        seen_numbers: set[str] = set()
-
-        for match in pattern.finditer(segment_text):
-            num = match.group('num')
-            if num in seen_numbers:
-                continue
-            start_idx = match.start('num')
-
-            prefix_chunk = segment_text[max(0, start_idx - 200):start_idx]
-            prefix_clean = re.sub(r'_+', ' ', prefix_chunk)
-            prefix_clean = normalize_whitespace(prefix_clean)
-            prefix_clean = strip_instruction_text(prefix_clean)
-            prefix_words = prefix_clean.split()
-            prefix = ' '.join(prefix_words[-8:])
-            if prefix:
-                prefix = re.sub(r'\b\d{1,2}\b', '', prefix)
-                prefix = re.split(r'[.;!?]', prefix)[-1].strip()
-                prefix = normalize_whitespace(prefix)
-
-            suffix_raw = match.group('after') or ''
-            suffix_raw_stripped = suffix_raw.lstrip()
-            post_blank_punct = ''
-            if suffix_raw_stripped and suffix_raw_stripped[0] in '.;,!?':
-                post_blank_punct = suffix_raw_stripped[0]
-                suffix_raw_stripped = suffix_raw_stripped[1:]
-
-            suffix_clean = re.sub(r'_+', ' ', suffix_raw_stripped)
-            suffix_clean = normalize_whitespace(suffix_clean)
-            suffix_clean = strip_instruction_text(suffix_clean)
-            suffix_words = suffix_clean.split()
-            suffix = ' '.join(suffix_words[:8])
-            if suffix:
-                suffix = re.sub(r'\b\d{1,2}\b', '', suffix)
-                suffix = re.split(r'[.;!?]', suffix)[0].strip()
-                suffix = normalize_whitespace(suffix)
-
-            snippet_parts: List[str] = []
-            if prefix:
-                snippet_parts.append(prefix)
-
-            blank_repr = '____'
-            if post_blank_punct:
-                blank_repr = f'____{post_blank_punct}'
-            snippet_parts.append(blank_repr)
-
-            append_suffix = bool(suffix)
-            if append_suffix and post_blank_punct and suffix and suffix[0].isalpha() and suffix[0].isupper():
-                append_suffix = False
-
-            if append_suffix:
-                snippet_parts.append(suffix)
-
-            snippet = ' '.join(snippet_parts).strip()
-            snippet = snippet.strip('-:;,')
-
-            lowered_snippet = snippet.lower()
-            if not snippet or 'write your answers' in lowered_snippet or 'complete the summary' in lowered_snippet:
-                continue
+    questions: List[Dict[str, Any]] = []
+    consumed_numbers: set[str] = set()
+    consumed_ranges: List[Tuple[int, int]] = []
+    # (stripped text, normalised text) pairs; the normalised side comes from the block table
+    question_blocks = _locate_question_blocks(questions_text, blocks)
+    # Heading positions are found once and shared by the section parsers below
+    heading_matches = find_question_headings(questions_text)
+
+    # consumed_ranges holds sorted, disjoint (start, end) spans: overlapping or
+    # touching ranges are merged on insert so a lookup only needs one bisect
+    def consume_range(start: int, end: int) -> None:
+        if start >= end:
+            return
+        lo = bisect_left(consumed_ranges, (start,))
+        if lo and consumed_ranges[lo - 1][1] >= start:
+            lo -= 1
+        hi = bisect_left(consumed_ranges, (end + 1,))
+        if lo < hi:
+            start = min(start, consumed_ranges[lo][0])
+            end = max(end, consumed_ranges[hi - 1][1])
+        consumed_ranges[lo:hi] = [(start, end)]
 
-            results.append({'type': 'fill_blank', 'number': num, 'text': snippet, 'match_start': match.start(), 'match_end': match.end()})
-            seen_numbers.add(num)
+    def is_consumed(start: int, end: int) -> bool:
+        if start < 0 or end < 0 or start >= end:
+            return False
+        idx = bisect_left(consumed_ranges, (end,))
+        return idx > 0 and consumed_ranges[idx - 1][1] > start
 
-        if results:
-            return results
+    # Text positions are only needed for ordering, so they are taken off each entry
+    # as it is accepted rather than stripped from every question at the end
+    positional_hints: List[float] = []
 
-        # Fallback: basic chunking if underscore matching fails
-        number_matches = list(re.finditer(r'\b(\d{1,2})\b', segment_text))
-        for idx, nm in enumerate(number_matches):
-            num = nm.group(1)
-            if num in seen_numbers:
-                continue
+    def add_question(entry: Dict[str, Any]) -> None:
+        start = entry.pop('match_start', None)
+        entry.pop('match_end', None)
+        questions.append(entry)
+        positional_hints.append(start if isinstance(start, int) else float('inf'))
 
-            start = nm.end()
-            end = number_matches[idx + 1].start() if idx + 1 < len(number_matches) else len(segment_text)
-            chunk = segment_text[start:end]
-            if '_' not in chunk:
-                continue
+    # Parse summary completion (has blanks with word bank)
+    summary = parse_summary_completion(questions_text, blocks)
+    if summary:
+        add_question(summary)
+        consumed_numbers.update(summary['blanks'])
 
-            cleaned = normalize_whitespace(chunk)
-            if not cleaned:
+    # Section parsers share one acceptance rule: a section is kept unless its text
+    # span or any of its question numbers has already been claimed
+    for parser, numbers_key, keyword_re in _SECTION_PARSERS:
+        # A parser with a keyword gate only accepts sections containing its keyword,
+        # so it is skipped outright when the keyword appears nowhere in the text
+        if keyword_re is not None and not keyword_re.search(questions_text):
+            continue
+        for section in parser(questions_text, heading_matches):
+            start = section.get('match_start', -1)
+            end = section.get('match_end', -1)
+            if is_consumed(start, end):
                 continue
+            section_numbers = {item['number'] for item in section.get(numbers_key) or ()}
+            if section_numbers & consumed_numbers:
+                continue
+            add_question(section)
+            consumed_numbers.update(section_numbers)
+            if start >= 0 and end >= 0:
+                consume_range(start, end)
 
-            results.append({'type': 'fill_blank', 'number': num, 'text': cleaned, 'match_start': nm.start(), 'match_end': end})
-            seen_numbers.add(num)
-
-        return results
+    # Parse short answer questions
+    short_answer_qs = parse_short_answer_questions(questions_text, heading_matches)
+    for q in short_answer_qs:
+        start = q.get('match_start', -1)
+        end = q.get('match_end', -1)
+        if q['number'] in consumed_numbers or is_consumed(start, end):
+            continue
+        add_question(q)
+        consumed_numbers.add(q['number'])
+        if start >= 0 and end >= 0:
+            consume_range(start, end)
 
-    fills = parse_fill_in_blanks(questions_text, question_blocks)
+    fills = parse_fill_in_blanks(
+        questions_text,
+        [raw_text for raw_text, _ in question_blocks],
+        [normalized_block for _, normalized_block in question_blocks]
+    )
     for f in fills:
         start = f.get('match_start', -1)
         end = f.get('match_end', -1)
         if f['number'] in consumed_numbers or is_consumed(start, end):
             continue
-        questions.append(f)
+        add_question(f)
         consumed_numbers.add(f['number'])
         if start >= 0 and end >= 0:
-            consumed_ranges.append((start, end))
+            consume_range(start, end)
 
     yes_no_sections = parse_yes_no_not_given(questions_text)
     for section in yes_no_sections:
         # This parser is section-based, so we assume it doesn't overlap badly
-        questions.append(section)
+        add_question(section)
         consumed_numbers.update(statement['number'] for statement in section['statements'])
 
     # Parse multi-answer MCQs (e.g., "Questions 25 and 26: Choose TWO letters")
@@ -2065,17 +2216,17 @@ def parse_questions(questions_text: str, blocks: Optional[List[Dict[str, Any]]]
     for mcq in multi_mcqs:
         if mcq['number'] in consumed_numbers:
             continue
-        questions.append(mcq)
-        consumed_numbers.add(mcq['number'])
         # Store the range but don't add to consumed_ranges yet
         start = mcq.get('match_start', -1)
         end = mcq.get('match_end', -1)
+        add_question(mcq)
+        consumed_numbers.add(mcq['number'])
         if start >= 0 and end >= 0:
             multi_mcq_range = (start, end)
     
     # Now add the range once after all multi-answer MCQs are processed
     if multi_mcq_range:
-        consumed_ranges.append(multi_mcq_range)
+        consume_range(*multi_mcq_range)
 
     # Parse single choice MCQs
     for single in parse_single_choice(questions_text):
@@ -2083,32 +2234,19 @@ def parse_questions(questions_text: str, blocks: Optional[List[Dict[str, Any]]]
         end = single.get('match_end', -1)
         if single['number'] in consumed_numbers or is_consumed(start, end):
             continue
-        questions.append(single)
+        add_question(single)
         if start >= 0 and end >= 0:
-            consumed_ranges.append((start, end))
+            consume_range(start, end)
 
     if questions:
-        ordered: List[Tuple[float, float, int, Dict[str, Any]]] = []
-        for idx, question in enumerate(questions):
-            section_numbers = collect_section_numbers(question)
-            first_number: Optional[int] = min(section_numbers) if section_numbers else None
-            positional_hint = question.get('match_start')
-            if not isinstance(positional_hint, int):
-                positional_hint = float('inf')
-            ordered.append((
-                float(first_number) if first_number is not None else float('inf'),
-                float(positional_hint),
-                idx,
-                question
-            ))
-
-        ordered.sort(key=lambda item: (item[0], item[1], item[2]))
-        questions = [entry[3] for entry in ordered]
-
-    # Clean up temporary keys from question dicts
-    for q in questions:
-        q.pop('match_start', None)
-        q.pop('match_end', None)
+        # Order by first question number, then text position; sorted() is stable, so
+        # ties keep insertion order without carrying the index in the key
+        sort_keys = [
+            (min(iter_section_numbers(question), default=float('inf')), hint)
+            for question, hint in zip(questions, positional_hints)
+        ]
+        order = sorted(range(len(questions)), key=sort_keys.__getitem__)
+        questions = [questions[idx] for idx in order]
 
     return questions
 
@@ -2118,6 +2256,41 @@ def index():
     return render_template('index.html')
 
 
+# Insertion-ordered so the least recently used entry is always first; shared by
+# the request threads, so every read and write holds _parsed_uploads_lock
+_parsed_uploads: Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
+_parsed_uploads_lock = threading.Lock()
+
+
+def parse_uploaded_pdf(filepath: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Return (structured passage, questions) for a PDF, reusing the result for identical content."""
+    data = filepath.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    with _parsed_uploads_lock:
+        cached = _parsed_uploads.pop(digest, None)
+        if cached is not None:
+            _parsed_uploads[digest] = cached
+            return cached
+
+    # Parsing runs outside the lock so one slow upload does not hold up the others
+    full_text, blocks = extract_text_and_blocks(filepath, data)
+    passage, question_text = split_passage_questions(full_text)
+    passage_blocks = collect_passage_blocks(passage, blocks)
+    parsed = (structure_passage(passage, passage_blocks), parse_questions(question_text, blocks))
+    if app.config['PARSE_CACHE_SIZE'] <= 0:
+        return parsed
+
+    with _parsed_uploads_lock:
+        # Another request may have cached the same upload meanwhile; keep its entry
+        cached = _parsed_uploads.pop(digest, None)
+        if cached is None:
+            cached = parsed
+            while len(_parsed_uploads) >= app.config['PARSE_CACHE_SIZE']:
+                _parsed_uploads.pop(next(iter(_parsed_uploads)))
+        _parsed_uploads[digest] = cached
+    return cached
+
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
     if 'file' not in request.files:
@@ -2140,11 +2313,7 @@ def upload_file():
     filepath = upload_folder / filename
     file.save(filepath)
 
-    full_text, blocks = extract_text_and_blocks(filepath)
-    passage, question_text = split_passage_questions(full_text)
-    passage_blocks = collect_passage_blocks(passage, blocks)
-    structured_passage = structure_passage(passage, passage_blocks)
-    parsed_questions = parse_questions(question_text, blocks)
+    structured_passage, parsed_questions = parse_uploaded_pdf(filepath)
 
     flash('File successfully uploaded')
     return render_template('passage.html', passage=structured_passage, questions=parsed_questions)
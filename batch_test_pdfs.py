@@ -6,11 +6,25 @@ Tests all PDFs to identify potential bugs in:
 2. Right side questions (completeness, type recognition, no mixing)
 3. Special attention to matching heading question types
 """
+import hashlib
+import os
+import pickle
+import queue
+import re
 import sys
+import threading
+import traceback
 import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Set, Tuple
-from collections import defaultdict
+from string import ascii_uppercase
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
+from collections import Counter
+
+import fitz  # PyMuPDF
 
 from app import (
     extract_text_and_blocks,
@@ -21,6 +35,56 @@ from app import (
 )
 from constants import SUBHEADING_KEYWORDS
 
+# Keywords that should never leak into the passage title
+INSTRUCTION_KEYWORDS = [
+    'reading passage', 'questions', 'you should spend',
+    'choose the correct', 'complete the', 'match the'
+]
+# One pass over lowered text instead of a substring scan per keyword
+INSTRUCTION_KEYWORD_RE = re.compile('|'.join(re.escape(k) for k in INSTRUCTION_KEYWORDS))
+SUBHEADING_KEYWORD_RE = re.compile('|'.join(re.escape(k) for k in SUBHEADING_KEYWORDS))
+
+# Contamination patterns for parsed question text
+BLANK_RE = re.compile(r'\d+\s*[_]{2,}')  # Numbered blanks like "27 _____"
+# More specific option pattern - must have 2+ spaces OR punctuation, and typically lowercase after
+# Examples: "A  methodology", "A) answer", "B: reason"
+# Not: "A typical tribe" (article + uppercase), "A cultured pearl" (article + uppercase)
+OPTION_LINE_RE = re.compile(r'^[A-Z](?:[):-]\s|\s{2,})(?:[a-z]|[A-Z][a-z])')
+QUESTION_HEADING_RE = re.compile(r'^(How|Why|What|When|Where|Which|Who|Complete|Choose|Write|Match)\s+', re.IGNORECASE)
+
+# Paragraph letters in order, as expected on a passage with no gaps
+EXPECTED_LETTERS = tuple(ascii_uppercase)
+
+# Where each question type keeps its numbers: (list key or None for the question
+# itself, number key or None when the list holds bare numbers)
+QUESTION_NUMBER_FIELDS = {
+    'single_choice': (None, 'number'),
+    'fill_blank': (None, 'number'),
+    'short_answer': (None, 'number'),
+    'paragraph_matching': ('statements', 'number'),
+    'yes_no_not_given': ('statements', 'number'),
+    'matching_features': ('statements', 'number'),
+    'matching_sentence_endings': ('statements', 'number'),
+    'matching_headings': ('paragraphs', 'number'),
+    'summary_completion': ('blanks', None),
+    'diagram_label_completion': ('labels', 'number'),
+}
+
+# Question types whose 'statements' are checked for contamination
+STATEMENT_TYPES = frozenset({
+    'yes_no_not_given',
+    'paragraph_matching',
+    'matching_features',
+    'matching_sentence_endings',
+})
+
+# Parsed (structured_passage, parsed_questions) per PDF, keyed by the PDF bytes
+# plus the parser sources, the PyMuPDF version (its block/line layout changes
+# between releases) and the Python version (pickle compatibility), so any change
+# to what produces a result invalidates it
+CACHE_DIR = Path(__file__).parent / '.pdftest_cache'
+_PARSER_SOURCES = ('app.py', 'constants.py')
+
 
 class PDFTestResult:
     """Container for test results for a single PDF."""
@@ -60,15 +124,13 @@ def test_left_side_formatting(structured_passage: Dict[str, Any], result: PDFTes
     elif len(title) > 150:
         result.add_warning(f"LEFT: Title seems too long ({len(title)} chars): '{title[:60]}...'")
     
-    # Check for instruction leakage in title
-    instruction_keywords = [
-        'reading passage', 'questions', 'you should spend',
-        'choose the correct', 'complete the', 'match the'
-    ]
+    # Check for instruction leakage in title; the combined regex screens the
+    # title, then each leaked keyword is reported in list order
     title_lower = title.lower()
-    for keyword in instruction_keywords:
-        if keyword in title_lower:
-            result.add_error(f"LEFT: Title contains instruction keyword '{keyword}': '{title}'")
+    if INSTRUCTION_KEYWORD_RE.search(title_lower):
+        for keyword in INSTRUCTION_KEYWORDS:
+            if keyword in title_lower:
+                result.add_error(f"LEFT: Title contains instruction keyword '{keyword}': '{title}'")
     
     result.add_info('title', title)
     
@@ -81,32 +143,25 @@ def test_left_side_formatting(structured_passage: Dict[str, Any], result: PDFTes
     
     result.add_info('paragraph_count', len(paragraphs))
     
-    # Check paragraph letters (for matching heading questions)
-    lettered_paras = [p for p in paragraphs if p.get('letter')]
-    if lettered_paras:
-        letters = [p['letter'] for p in lettered_paras]
-        result.add_info('paragraph_letters', letters)
-        
-        # Check for gaps in lettering
-        if letters:
-            expected_letters = []
-            for i in range(len(letters)):
-                expected_letters.append(chr(ord('A') + i))
-            
-            if letters != expected_letters:
-                result.add_warning(f"LEFT: Paragraph letters not sequential: {letters} (expected: {expected_letters})")
-    
-    # Check for standalone subheadings (common bug)
+    # One pass collects paragraph letters (for matching heading questions) and
+    # standalone subheadings (common bug: short keyword paragraphs left unmerged)
+    letters = []
     standalone_subheadings = []
-    
     for para in paragraphs:
+        letter = para.get('letter')
+        if letter:
+            letters.append(letter)
         text = para.get('text', '').strip()
-        if len(text) < 60:  # Short paragraphs might be subheadings
-            text_lower = text.lower()
-            for keyword in SUBHEADING_KEYWORDS:
-                if keyword in text_lower and len(text) < 100:
-                    standalone_subheadings.append(text)
-                    break
+        if len(text) < 60 and SUBHEADING_KEYWORD_RE.search(text.lower()):
+            standalone_subheadings.append(text)
+    
+    if letters:
+        result.add_info('paragraph_letters', letters)
+        
+        # Check for gaps in lettering; the expected list is only built for the warning
+        if tuple(letters) != EXPECTED_LETTERS[:len(letters)]:
+            expected_letters = list(EXPECTED_LETTERS[:len(letters)])
+            result.add_warning(f"LEFT: Paragraph letters not sequential: {letters} (expected: {expected_letters})")
     
     if standalone_subheadings:
         result.add_error(f"LEFT: Found {len(standalone_subheadings)} standalone subheadings: {standalone_subheadings[:2]}")
@@ -125,10 +180,7 @@ def test_right_side_questions(parsed_questions: List[Dict[str, Any]], result: PD
     result.add_info('question_count', len(parsed_questions))
     
     # Count question types
-    question_types = defaultdict(int)
-    for q in parsed_questions:
-        q_type = q.get('type', 'unknown')
-        question_types[q_type] += 1
+    question_types = Counter(q.get('type', 'unknown') for q in parsed_questions)
     
     result.add_info('question_types', dict(question_types))
     
@@ -136,75 +188,41 @@ def test_right_side_questions(parsed_questions: List[Dict[str, Any]], result: PD
     if 'unknown' in question_types:
         result.add_error(f"RIGHT: {question_types['unknown']} questions with unknown type")
     
-    # Collect all question numbers
+    # Collect all question numbers as the strings the parser produced, so
+    # '07' and '7' stay distinct
     question_numbers: Set[str] = set()
     duplicate_numbers: List[str] = []
     
+    def mark(num: str):
+        if num in question_numbers:
+            duplicate_numbers.append(num)
+        question_numbers.add(num)
+    
     for q in parsed_questions:
-        q_type = q.get('type')
-        
-        # Extract numbers based on question type
-        if q_type == 'single_choice':
-            num = q.get('number')
+        fields = QUESTION_NUMBER_FIELDS.get(q.get('type'))
+        if fields is None:
+            continue
+        list_key, number_key = fields
+        if list_key is None:
+            num = q.get(number_key)
             if num:
-                if num in question_numbers:
-                    duplicate_numbers.append(num)
-                question_numbers.add(num)
-        
-        elif q_type == 'fill_blank':
-            num = q.get('number')
-            if num:
-                if num in question_numbers:
-                    duplicate_numbers.append(num)
-                question_numbers.add(num)
-        
-        elif q_type == 'short_answer':
-            num = q.get('number')
-            if num:
-                if num in question_numbers:
-                    duplicate_numbers.append(num)
-                question_numbers.add(num)
-        
-        elif q_type in ['paragraph_matching', 'yes_no_not_given', 'matching_features', 
-                        'matching_sentence_endings']:
-            statements = q.get('statements', [])
-            for stmt in statements:
-                num = stmt.get('number')
-                if num:
-                    if num in question_numbers:
-                        duplicate_numbers.append(num)
-                    question_numbers.add(num)
-        
-        elif q_type == 'matching_headings':
-            paragraphs = q.get('paragraphs', [])
-            for para in paragraphs:
-                num = para.get('number')
-                if num:
-                    if num in question_numbers:
-                        duplicate_numbers.append(num)
-                    question_numbers.add(num)
-        
-        elif q_type == 'summary_completion':
-            for num in q.get('blanks', []):
-                if num in question_numbers:
-                    duplicate_numbers.append(num)
-                question_numbers.add(num)
-        
-        elif q_type == 'diagram_label_completion':
-            labels = q.get('labels', [])
-            for label in labels:
-                num = label.get('number')
+                mark(num)
+        elif number_key is None:
+            # Bare values (summary blanks) are taken as-is
+            for num in q.get(list_key, []):
+                mark(num)
+        else:
+            for item in q.get(list_key, []):
+                num = item.get(number_key)
                 if num:
-                    if num in question_numbers:
-                        duplicate_numbers.append(num)
-                    question_numbers.add(num)
+                    mark(num)
     
     # Report duplicates
     if duplicate_numbers:
         result.add_error(f"RIGHT: Duplicate question numbers detected: {duplicate_numbers}")
     
     result.add_info('total_questions', len(question_numbers))
-    result.add_info('question_numbers', sorted([int(n) for n in question_numbers if n.isdigit()]))
+    result.add_info('question_numbers', sorted(int(n) for n in question_numbers if n.isdigit()))
 
 
 def test_matching_headings_special(parsed_questions: List[Dict[str, Any]], 
@@ -219,6 +237,11 @@ def test_matching_headings_special(parsed_questions: List[Dict[str, Any]],
     if not matching_heading_questions:
         return  # No matching headings in this PDF
     
+    # Lettered passage paragraphs, shared by every matching-headings question
+    passage_letters = [letter for letter in (p.get('letter') for p in structured_passage.get('paragraphs', []))
+                       if letter]
+    passage_letter_set = set(passage_letters)
+    
     for mh_q in matching_heading_questions:
         # Check that headings exist
         headings = mh_q.get('headings', [])
@@ -238,16 +261,13 @@ def test_matching_headings_special(parsed_questions: List[Dict[str, Any]],
         if not paragraphs:
             result.add_error("MATCHING HEADINGS: No paragraph mappings found")
         else:
-            # Verify paragraph letters match passage structure
-            passage_letters = [p.get('letter') for p in structured_passage.get('paragraphs', []) 
-                             if p.get('letter')]
-            question_letters = [p.get('letter') for p in paragraphs]
-            
-            # Check if question letters are subset of passage letters
-            for qletter in question_letters:
-                if qletter not in passage_letters:
-                    result.add_warning(f"MATCHING HEADINGS: Question references paragraph '{qletter}' "
-                                     f"not found in passage (passage has: {passage_letters})")
+            # Verify paragraph letters match passage structure: question letters
+            # should be a subset of passage letters, reported in one warning
+            missing_letters = [qletter for qletter in (p.get('letter') for p in paragraphs)
+                               if qletter not in passage_letter_set]
+            if missing_letters:
+                result.add_warning(f"MATCHING HEADINGS: Question references paragraph(s) {missing_letters} "
+                                   f"not found in passage (passage has: {passage_letters})")
         
         # Check instructions
         instructions = mh_q.get('instructions', [])
@@ -260,44 +280,34 @@ def test_content_contamination(parsed_questions: List[Dict[str, Any]], result: P
     Advanced test to detect cross-contamination between questions.
     Checks for content from other question types bleeding into statements/text.
     """
-    import re
-    
-    # Contamination patterns to detect
-    blank_pattern = re.compile(r'\d+\s*[_]{2,}')  # Numbered blanks like "27 _____"
-    # More specific option pattern - must have 2+ spaces OR punctuation, and typically lowercase after
-    # Examples: "A  methodology", "A) answer", "B: reason"
-    # Not: "A typical tribe" (article + uppercase), "A cultured pearl" (article + uppercase)
-    option_pattern = re.compile(r'^[A-Z](?:[):-]\s|\s{2,})(?:[a-z]|[A-Z][a-z])')
-    question_heading_pattern = re.compile(r'^(How|Why|What|When|Where|Which|Who|Complete|Choose|Write|Match)\s+', re.IGNORECASE)
-    
     for q in parsed_questions:
         q_type = q.get('type')
         
         # Check YES/NO/NOT GIVEN and similar statement-based questions
-        if q_type in ['yes_no_not_given', 'paragraph_matching', 'matching_features', 'matching_sentence_endings']:
+        if q_type in STATEMENT_TYPES:
             statements = q.get('statements', [])
             for stmt in statements:
                 num = stmt.get('number', '?')
                 text = stmt.get('text', '')
                 
                 # Check for numbered blank contamination (from summary completion)
-                if blank_pattern.search(text):
+                if BLANK_RE.search(text):
                     result.add_error(f"CONTAMINATION: Q{num} ({q_type}) contains numbered blanks: '{text[:100]}'")
                 
                 # Check for option list contamination
                 lines = text.split('\n')
                 for line in lines:
                     stripped = line.strip()
-                    if option_pattern.match(stripped):
+                    if OPTION_LINE_RE.match(stripped):
                         result.add_error(f"CONTAMINATION: Q{num} ({q_type}) contains option list: '{stripped[:60]}'")
                 
                 # Check for question heading contamination (except at start of question text)
-                if question_heading_pattern.search(text[20:]):  # Skip first 20 chars to allow legitimate questions
-                    # Find the match
-                    match = question_heading_pattern.search(text[20:])
-                    if match:
-                        context = text[20 + match.start():20 + match.start() + 80]
-                        result.add_warning(f"CONTAMINATION?: Q{num} ({q_type}) may contain question heading: '{context}'")
+                # Skip first 20 chars to allow legitimate questions; the pattern is
+                # anchored, so it is searched on the slice rather than from pos=20
+                match = QUESTION_HEADING_RE.search(text[20:])
+                if match:
+                    context = text[20 + match.start():20 + match.start() + 80]
+                    result.add_warning(f"CONTAMINATION?: Q{num} ({q_type}) may contain question heading: '{context}'")
                 
                 # Check for excessive length (likely contamination)
                 if len(text) > 500:
@@ -310,7 +320,7 @@ def test_content_contamination(parsed_questions: List[Dict[str, Any]], result: P
             options = q.get('options', [])
             
             # Check for blank contamination in MCQ text
-            if blank_pattern.search(text):
+            if BLANK_RE.search(text):
                 result.add_error(f"CONTAMINATION: Q{num} (MCQ) contains numbered blanks")
             
             # Check for excessive options (should be 4-5 typically)
@@ -319,7 +329,7 @@ def test_content_contamination(parsed_questions: List[Dict[str, Any]], result: P
             
             # Check if options look contaminated (contain question-like text)
             for opt in options[:5]:  # Check first 5 options
-                if blank_pattern.search(opt):
+                if BLANK_RE.search(opt):
                     result.add_error(f"CONTAMINATION: Q{num} (MCQ) option contains blanks: '{opt[:60]}'")
         
         # Check summary completion
@@ -332,25 +342,80 @@ def test_content_contamination(parsed_questions: List[Dict[str, Any]], result: P
                 opt_text = opt.get('text', '')
                 # Check if full option text appears in summary (contamination)
                 # Skip if it's a common word that might legitimately appear
-                if opt_text and len(opt_text) > 8 and opt_text.lower() not in ['persia', 'persian'] and opt_text in text:
+                if opt_text and len(opt_text) > 8 and opt_text.lower() not in ('persia', 'persian') and opt_text in text:
                     result.add_warning(f"CONTAMINATION?: Summary contains option text: '{opt_text}'")
             
             # Check for question heading in summary
-            if question_heading_pattern.match(text):
+            if QUESTION_HEADING_RE.match(text):
                 result.add_warning(f"CONTAMINATION?: Summary starts with question heading")
 
 
-def test_single_pdf(pdf_path: Path) -> PDFTestResult:
-    """Test a single PDF file."""
+def parse_pdf(pdf_path: Path, data: Optional[bytes] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Run the extraction and parsing pipeline on one PDF (data: its bytes, if already read)."""
+    full_text, blocks = extract_text_and_blocks(str(pdf_path), data)
+    passage, question_text = split_passage_questions(full_text)
+    passage_blocks = collect_passage_blocks(passage, blocks)
+    structured_passage = structure_passage(passage, passage_blocks)
+    parsed_questions = parse_questions(question_text, blocks)
+    return structured_passage, parsed_questions
+
+
+@lru_cache(maxsize=None)
+def parser_sources_digest() -> bytes:
+    """Hash of the parser sources and the PyMuPDF/Python versions, read once per process."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"pymupdf {fitz.VersionBind}; python {sys.version_info[0]}.{sys.version_info[1]}\n".encode())
+    base_dir = Path(__file__).parent
+    for name in _PARSER_SOURCES:
+        digest.update((base_dir / name).read_bytes())
+    return digest.digest()
+
+
+def cache_key(data: bytes) -> str:
+    """Content hash of the PDF bytes and the parser sources."""
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(parser_sources_digest())
+    return digest.hexdigest()
+
+
+def init_worker():
+    """Pool initializer: pay per-process setup once per worker, not per PDF."""
+    parser_sources_digest()
+
+
+def parse_pdf_cached(pdf_path: Path, data: Optional[bytes] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """parse_pdf() backed by the on-disk cache in CACHE_DIR."""
+    if data is None:
+        data = pdf_path.read_bytes()
+    cache_file = CACHE_DIR / f"{cache_key(data)}.pkl"
+    if cache_file.exists():
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    
+    parsed = parse_pdf(pdf_path, data)
+    CACHE_DIR.mkdir(exist_ok=True)
+    # Write then rename so parallel workers never read a partial file
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    return parsed
+
+
+def test_single_pdf(pdf_path: Path, use_cache: bool = True, data: Optional[bytes] = None,
+                    tracebacks: bool = False) -> PDFTestResult:
+    """
+    Test a single PDF file (data: its bytes, if already read). With tracebacks,
+    an exception is reported in full along with the line that raised it.
+    """
     result = PDFTestResult(pdf_path.name)
     
     try:
         # Extract and parse
-        full_text, blocks = extract_text_and_blocks(str(pdf_path))
-        passage, question_text = split_passage_questions(full_text)
-        passage_blocks = collect_passage_blocks(passage, blocks)
-        structured_passage = structure_passage(passage, passage_blocks)
-        parsed_questions = parse_questions(question_text, blocks)
+        if use_cache:
+            structured_passage, parsed_questions = parse_pdf_cached(pdf_path, data)
+        else:
+            structured_passage, parsed_questions = parse_pdf(pdf_path, data)
         
         # Run tests
         test_left_side_formatting(structured_passage, result)
@@ -359,12 +424,90 @@ def test_single_pdf(pdf_path: Path) -> PDFTestResult:
         test_content_contamination(parsed_questions, result)  # New comprehensive test
         
     except Exception as e:
-        result.add_error(f"EXCEPTION: {type(e).__name__}: {str(e)[:200]}")
+        if tracebacks:
+            # Only the exception text and the innermost frame; no locals or full stack
+            message = ''.join(traceback.format_exception_only(type(e), e)).strip()
+            frame = traceback.extract_tb(e.__traceback__, limit=-1)[0]
+            result.add_error(f"EXCEPTION: {message} ({Path(frame.filename).name}:{frame.lineno} in {frame.name})")
+        else:
+            result.add_error(f"EXCEPTION: {type(e).__name__}: {str(e)[:200]}")
     
     return result
 
 
-def run_batch_test(pdf_dir: Path = None, max_pdfs: int = None, verbose: bool = False):
+def prefetch_pdf_bytes(pdf_files: List[Path], depth: int = 4) -> Iterator[Tuple[Path, Optional[bytes]]]:
+    """
+    Yield (path, bytes) pairs while a background thread reads ahead up to
+    `depth` files, so disk reads overlap with parsing the current PDF.
+    Unreadable files yield None and are re-read (and reported) by the test.
+    """
+    buffered: queue.Queue = queue.Queue(maxsize=depth)
+    
+    def reader():
+        for pdf_file in pdf_files:
+            try:
+                data = pdf_file.read_bytes()
+            except OSError:
+                data = None
+            buffered.put((pdf_file, data))
+    
+    threading.Thread(target=reader, daemon=True).start()
+    for _ in pdf_files:
+        yield buffered.get()
+
+
+# Report category for each error-message prefix (the text before the first colon)
+ERROR_CATEGORIES = {
+    'LEFT': 'Left Side (Passage)',
+    'RIGHT': 'Right Side (Questions)',
+    'MATCHING HEADINGS': 'Matching Headings',
+}
+
+
+def error_category(error: str) -> str:
+    """Report category for an error message, taken from its prefix."""
+    prefix, colon, _ = error.partition(':')
+    return ERROR_CATEGORIES.get(prefix, 'Other') if colon else 'Other'
+
+
+def print_pdf_result(result: PDFTestResult, verbose: bool, header: str = ''):
+    """
+    Print the per-PDF status line(s) shown during a batch run, preceded by
+    header if given, with a single write.
+    """
+    lines = [header] if header else []
+    if verbose or not result.passed:
+        # Show details for failed tests or in verbose mode
+        lines.extend(f"    ❌ {error}" for error in result.errors)
+        lines.extend(f"    ⚠️  {warning}" for warning in result.warnings)
+        if result.passed and not result.warnings:
+            lines.append(f"    ✅ PASSED")
+    else:
+        # Just show status
+        status = "✅ PASS" if result.passed else "❌ FAIL"
+        lines.append(f"    {status}")
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def write_json_record(f, result: PDFTestResult, first: bool):
+    """
+    Append one result to a JSON array being written to f. Together with the
+    closing write in run_batch_test the file matches json.dump(..., indent=2).
+    """
+    record = json.dumps({
+        'filename': result.filename,
+        'passed': result.passed,
+        'errors': result.errors,
+        'warnings': result.warnings,
+        'info': result.info
+    }, indent=2)
+    f.write('[\n  ' if first else ',\n  ')
+    f.write(record.replace('\n', '\n  '))
+
+
+def run_batch_test(pdf_dir: Path = None, max_pdfs: int = None, verbose: bool = False, workers: int = 1,
+                   use_cache: bool = True, json_path: Optional[str] = None, tracebacks: bool = False):
     """
     Run batch test on all PDFs in the directory.
     
@@ -372,6 +515,10 @@ def run_batch_test(pdf_dir: Path = None, max_pdfs: int = None, verbose: bool = F
         pdf_dir: Directory containing PDFs (default: ./pdf)
         max_pdfs: Maximum number of PDFs to test (default: all)
         verbose: Show detailed output for each PDF
+        workers: Number of worker processes (default: 1, run in this process)
+        use_cache: Reuse parse results cached in CACHE_DIR (default: True)
+        json_path: Write each result to this JSON file as soon as it completes
+        tracebacks: Report exceptions in full, with the line that raised them
     """
     if pdf_dir is None:
         pdf_dir = Path(__file__).parent / "pdf"
@@ -386,36 +533,42 @@ def run_batch_test(pdf_dir: Path = None, max_pdfs: int = None, verbose: bool = F
     print(f"{'='*80}\n")
     
     results: List[PDFTestResult] = []
-    
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"[{i}/{len(pdf_files)}] Testing: {pdf_file.name[:70]}")
+    with ExitStack() as stack:
+        json_file = stack.enter_context(open(json_path, 'w')) if json_path else None
+        if json_file is not None:
+            # Close the array before the file closes, even when a worker raises or
+            # the run is interrupted, so the file on disk is always valid JSON
+            stack.callback(lambda: json_file.write('\n]' if results else '[]'))
         
-        result = test_single_pdf(pdf_file)
-        results.append(result)
+        def record_result(result: PDFTestResult, header: str = ''):
+            if json_file is not None:
+                write_json_record(json_file, result, first=not results)
+            results.append(result)
+            print_pdf_result(result, verbose, header)
         
-        if verbose or not result.passed:
-            # Show details for failed tests or in verbose mode
-            if result.errors:
-                for error in result.errors:
-                    print(f"    ❌ {error}")
-            if result.warnings:
-                for warning in result.warnings:
-                    print(f"    ⚠️  {warning}")
-            if result.passed and not result.warnings:
-                print(f"    ✅ PASSED")
+        if workers > 1:
+            # Each PDF is independent; map() yields results in input order, so the
+            # progress output matches a sequential run. Warming up here first lets
+            # forked workers inherit the state; init_worker covers spawned ones.
+            init_worker()
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+                pdf_results = executor.map(partial(test_single_pdf, use_cache=use_cache, tracebacks=tracebacks), pdf_files, chunksize=4)
+                for i, (pdf_file, result) in enumerate(zip(pdf_files, pdf_results), 1):
+                    # Results arrive already finished, so header and status go out together
+                    record_result(result, f"[{i}/{len(pdf_files)}] Testing: {pdf_file.name[:70]}")
         else:
-            # Just show status
-            status = "✅ PASS" if result.passed else "❌ FAIL"
-            print(f"    {status}")
+            for i, (pdf_file, data) in enumerate(prefetch_pdf_bytes(pdf_files), 1):
+                print(f"[{i}/{len(pdf_files)}] Testing: {pdf_file.name[:70]}")
+                record_result(test_single_pdf(pdf_file, use_cache, data, tracebacks))
     
     # Summary
     print(f"\n{'='*80}")
     print("BATCH TEST SUMMARY")
     print(f"{'='*80}\n")
     
-    passed = sum(1 for r in results if r.passed)
-    failed = sum(1 for r in results if not r.passed)
     total = len(results)
+    passed = sum(1 for r in results if r.passed)
+    failed = total - passed
     
     print(f"✅ Passed:  {passed}/{total} ({100*passed/total:.1f}%)")
     print(f"❌ Failed:  {failed}/{total} ({100*failed/total:.1f}%)")
@@ -425,17 +578,7 @@ def run_batch_test(pdf_dir: Path = None, max_pdfs: int = None, verbose: bool = F
     print("ISSUES BY CATEGORY")
     print(f"{'='*80}\n")
     
-    category_counts = defaultdict(int)
-    for result in results:
-        for error in result.errors:
-            if error.startswith('LEFT:'):
-                category_counts['Left Side (Passage)'] += 1
-            elif error.startswith('RIGHT:'):
-                category_counts['Right Side (Questions)'] += 1
-            elif error.startswith('MATCHING HEADINGS:'):
-                category_counts['Matching Headings'] += 1
-            else:
-                category_counts['Other'] += 1
+    category_counts = Counter(map(error_category, chain.from_iterable(r.errors for r in results)))
     
     for category, count in sorted(category_counts.items()):
         print(f"{category}: {count} issues")
@@ -458,19 +601,17 @@ def run_batch_test(pdf_dir: Path = None, max_pdfs: int = None, verbose: bool = F
                     print(f"   ℹ️  Info: {result.info}")
     
     # Warning summary
-    warnings_count = sum(len(r.warnings) for r in results)
+    # Warning type is the part before the first colon; the total falls out of the counts
+    warning_types = Counter(
+        warning.partition(':')[0] if ':' in warning else warning[:50]
+        for warning in chain.from_iterable(r.warnings for r in results)
+    )
+    warnings_count = sum(warning_types.values())
     if warnings_count > 0:
         print(f"\n{'='*80}")
         print(f"WARNINGS SUMMARY ({warnings_count} total)")
         print(f"{'='*80}\n")
         
-        warning_types = defaultdict(int)
-        for result in results:
-            for warning in result.warnings:
-                # Extract warning type (first part before colon)
-                warning_type = warning.split(':', 1)[0] if ':' in warning else warning[:50]
-                warning_types[warning_type] += 1
-        
         for wtype, count in sorted(warning_types.items(), key=lambda x: -x[1]):
             print(f"{wtype}: {count} occurrences")
     
@@ -479,11 +620,9 @@ def run_batch_test(pdf_dir: Path = None, max_pdfs: int = None, verbose: bool = F
     print(f"{'='*80}\n")
     
     # Question type statistics
-    all_question_types = defaultdict(int)
+    all_question_types = Counter()
     for result in results:
-        q_types = result.info.get('question_types', {})
-        for qtype, count in q_types.items():
-            all_question_types[qtype] += count
+        all_question_types.update(result.info.get('question_types', {}))
     
     print("Question types across all PDFs:")
     for qtype, count in sorted(all_question_types.items(), key=lambda x: -x[1]):
@@ -499,25 +638,21 @@ if __name__ == '__main__':
     parser.add_argument('--max', type=int, help='Maximum number of PDFs to test')
     parser.add_argument('--verbose', action='store_true', help='Show detailed output')
     parser.add_argument('--json', type=str, help='Save results to JSON file')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes (0 = one per CPU core)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse every PDF instead of using the parse cache')
+    parser.add_argument('--tracebacks', action='store_true',
+                        help='Show full exception messages and where they were raised')
     
     args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
     
-    results, passed, failed = run_batch_test(max_pdfs=args.max, verbose=args.verbose)
+    results, passed, failed = run_batch_test(max_pdfs=args.max, verbose=args.verbose, workers=workers,
+                                             use_cache=not args.no_cache, json_path=args.json,
+                                             tracebacks=args.tracebacks)
     
     if args.json:
-        # Save results to JSON
-        json_data = []
-        for result in results:
-            json_data.append({
-                'filename': result.filename,
-                'passed': result.passed,
-                'errors': result.errors,
-                'warnings': result.warnings,
-                'info': result.info
-            })
-        
-        with open(args.json, 'w') as f:
-            json.dump(json_data, f, indent=2)
         print(f"\n✅ Results saved to {args.json}")
     
     sys.exit(0 if failed == 0 else 1)
@@ -3,8 +3,9 @@ Shared constants for IELTS Reading PDF processing and testing.
 """
 
 # Subheading keywords used to identify standalone section headers that should be
-# merged with the following paragraph content
-SUBHEADING_KEYWORDS = [
+# merged with the following paragraph content (lower-case; a tuple since it is
+# only ever compiled into keyword regexes)
+SUBHEADING_KEYWORDS = (
     'introduction',
     'background',
     'conclusion',
@@ -15,4 +16,4 @@ SUBHEADING_KEYWORDS = [
     'description of',
     'methodological issues',
     'lessons to consider',
-]
+)
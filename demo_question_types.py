@@ -2,6 +2,8 @@
 """
 Demo script showing all 10 IELTS question types being recognized
 """
+from collections import Counter
+
 from app import parse_questions
 
 # Sample text with multiple question types
@@ -108,93 +110,95 @@ Write NO MORE THAN THREE WORDS AND/OR A NUMBER for each answer.
 30 Where were the findings first presented?
 """
 
-print("="*70)
-print("IELTS READING TRANSFORMER - QUESTION TYPE RECOGNITION DEMO")
-print("="*70)
-print("\nProcessing sample question text with all 10 question types...\n")
-
-# Parse all questions
-questions = parse_questions(demo_text)
-
-print(f"✓ Successfully parsed {len(questions)} question groups\n")
-print("-"*70)
-
-# Display results by type
-type_counts = {}
-for q in questions:
-    q_type = q.get('type', 'unknown')
-    type_counts[q_type] = type_counts.get(q_type, 0) + 1
-
-print("Question Types Recognized:\n")
-
-type_names = {
-    'single_choice': '1. Multiple Choice Questions (MCQ)',
-    'yes_no_not_given': '2. True/False/Not Given OR Yes/No/Not Given',
-    'matching_headings': '3. Matching Headings',
-    'paragraph_matching': '4. Matching Information',
-    'matching_features': '5. Matching Features',
-    'matching_sentence_endings': '6. Matching Sentence Endings',
-    'summary_completion': '7. Summary/Note/Table Completion',
-    'diagram_label_completion': '8. Diagram Label Completion',
-    'short_answer': '9. Short-Answer Questions',
-    'fill_blank': '10. Sentence Completion (Fill-in-the-Blank)'
-}
-
-for q_type, count in sorted(type_counts.items()):
-    type_name = type_names.get(q_type, q_type)
-    print(f"   ✓ {type_name}: {count} section(s)")
-
-print("\n" + "-"*70)
-print("\nDetailed breakdown:\n")
-
-for idx, q in enumerate(questions, 1):
-    q_type = q.get('type', 'unknown')
-    type_name = type_names.get(q_type, q_type)
-    
-    print(f"{idx}. {type_name}")
-    
-    if q_type == 'single_choice':
-        print(f"   - {len(q.get('options', []))} options per question")
-        if 'number' in q:
-            print(f"   - Question {q['number']}: {q.get('text', '')[:50]}...")
-    
-    elif q_type in ['yes_no_not_given']:
-        print(f"   - Title: {q.get('title', '')[:60]}...")
-        print(f"   - {len(q.get('statements', []))} statements")
-        print(f"   - Options: {', '.join(q.get('options', []))}")
-    
-    elif q_type == 'matching_headings':
-        print(f"   - {len(q.get('headings', []))} headings available")
-        print(f"   - {len(q.get('paragraphs', []))} paragraphs to match")
-    
-    elif q_type == 'paragraph_matching':
-        print(f"   - {len(q.get('statements', []))} statements")
-        print(f"   - Paragraph options: {', '.join(q.get('options', [])[:5])}")
-    
-    elif q_type == 'matching_features':
-        print(f"   - {len(q.get('features', []))} features/entities")
-        print(f"   - {len(q.get('statements', []))} statements to match")
-    
-    elif q_type == 'matching_sentence_endings':
-        print(f"   - {len(q.get('sentence_beginnings', []))} sentence beginnings")
-        print(f"   - {len(q.get('endings', []))} possible endings")
-    
-    elif q_type == 'summary_completion':
-        print(f"   - {len(q.get('blanks', []))} blanks to fill")
-        print(f"   - {len(q.get('options', []))} word bank options")
-    
-    elif q_type == 'diagram_label_completion':
-        print(f"   - {len(q.get('labels', []))} labels to complete")
-    
-    elif q_type == 'short_answer':
-        print(f"   - Question {q.get('number', '')}: {q.get('text', '')[:50]}...")
-        print(f"   - Word limit: {q.get('word_limit', 'N/A')}")
-    
-    elif q_type == 'fill_blank':
-        print(f"   - Question {q.get('number', '')}: {q.get('text', '')[:50]}...")
-    
-    print()
-
-print("="*70)
-print("✓ DEMO COMPLETE - All IELTS question types successfully recognized!")
-print("="*70)
+def main():
+    print("="*70)
+    print("IELTS READING TRANSFORMER - QUESTION TYPE RECOGNITION DEMO")
+    print("="*70)
+    print("\nProcessing sample question text with all 10 question types...\n")
+
+    # Parse all questions
+    questions = parse_questions(demo_text)
+
+    print(f"✓ Successfully parsed {len(questions)} question groups\n")
+    print("-"*70)
+
+    # Display results by type
+    type_counts = Counter(q.get('type', 'unknown') for q in questions)
+
+    print("Question Types Recognized:\n")
+
+    type_names = {
+        'single_choice': '1. Multiple Choice Questions (MCQ)',
+        'yes_no_not_given': '2. True/False/Not Given OR Yes/No/Not Given',
+        'matching_headings': '3. Matching Headings',
+        'paragraph_matching': '4. Matching Information',
+        'matching_features': '5. Matching Features',
+        'matching_sentence_endings': '6. Matching Sentence Endings',
+        'summary_completion': '7. Summary/Note/Table Completion',
+        'diagram_label_completion': '8. Diagram Label Completion',
+        'short_answer': '9. Short-Answer Questions',
+        'fill_blank': '10. Sentence Completion (Fill-in-the-Blank)'
+    }
+
+    for q_type, count in sorted(type_counts.items()):
+        type_name = type_names.get(q_type, q_type)
+        print(f"   ✓ {type_name}: {count} section(s)")
+
+    print("\n" + "-"*70)
+    print("\nDetailed breakdown:\n")
+
+    for idx, q in enumerate(questions, 1):
+        q_type = q.get('type', 'unknown')
+        type_name = type_names.get(q_type, q_type)
+
+        print(f"{idx}. {type_name}")
+
+        if q_type == 'single_choice':
+            print(f"   - {len(q.get('options', []))} options per question")
+            if 'number' in q:
+                print(f"   - Question {q['number']}: {q.get('text', '')[:50]}...")
+
+        elif q_type in ['yes_no_not_given']:
+            print(f"   - Title: {q.get('title', '')[:60]}...")
+            print(f"   - {len(q.get('statements', []))} statements")
+            print(f"   - Options: {', '.join(q.get('options', []))}")
+
+        elif q_type == 'matching_headings':
+            print(f"   - {len(q.get('headings', []))} headings available")
+            print(f"   - {len(q.get('paragraphs', []))} paragraphs to match")
+
+        elif q_type == 'paragraph_matching':
+            print(f"   - {len(q.get('statements', []))} statements")
+            print(f"   - Paragraph options: {', '.join(q.get('options', [])[:5])}")
+
+        elif q_type == 'matching_features':
+            print(f"   - {len(q.get('features', []))} features/entities")
+            print(f"   - {len(q.get('statements', []))} statements to match")
+
+        elif q_type == 'matching_sentence_endings':
+            print(f"   - {len(q.get('sentence_beginnings', []))} sentence beginnings")
+            print(f"   - {len(q.get('endings', []))} possible endings")
+
+        elif q_type == 'summary_completion':
+            print(f"   - {len(q.get('blanks', []))} blanks to fill")
+            print(f"   - {len(q.get('options', []))} word bank options")
+
+        elif q_type == 'diagram_label_completion':
+            print(f"   - {len(q.get('labels', []))} labels to complete")
+
+        elif q_type == 'short_answer':
+            print(f"   - Question {q.get('number', '')}: {q.get('text', '')[:50]}...")
+            print(f"   - Word limit: {q.get('word_limit', 'N/A')}")
+
+        elif q_type == 'fill_blank':
+            print(f"   - Question {q.get('number', '')}: {q.get('text', '')[:50]}...")
+
+        print()
+
+    print("="*70)
+    print("✓ DEMO COMPLETE - All IELTS question types successfully recognized!")
+    print("="*70)
+
+
+if __name__ == '__main__':
+    main()
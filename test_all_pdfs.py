@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """
 Comprehensive test for ALL available PDF files.
-Tests all 20 PDFs in the repository to ensure robustness.
+Tests every PDF in the collection to ensure robustness.
 """
+import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Any, Dict, List
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -15,6 +21,27 @@ from app import (
     collect_passage_blocks,
     parse_questions,
 )
+from test_helpers import STANDALONE_SUBHEADINGS, iter_question_numbers
+
+
+# "60. P3 - Title 中文标题【高】.pdf": collection number, then the English title
+# up to the first CJK character or bracket
+_PDF_NUMBER_RE = re.compile(r'^(\d+)\.')
+_PDF_TITLE_RE = re.compile(r' - (.*?)\s*(?:[\u3000-\u303f\u4e00-\u9fff\uff00-\uffef]|$)')
+
+
+def discover_pdfs(base_path: Path) -> List[Path]:
+    """All PDFs under base_path, ordered by their collection number."""
+    def collection_order(pdf_path: Path):
+        match = _PDF_NUMBER_RE.match(pdf_path.name)
+        return (int(match.group(1)) if match else float('inf'), pdf_path.name)
+    return sorted(base_path.glob('*.pdf'), key=collection_order)
+
+
+def pdf_test_name(pdf_path: Path) -> str:
+    """Short display name for a PDF, taken from the English part of its title."""
+    match = _PDF_TITLE_RE.search(pdf_path.stem)
+    return (match.group(1) if match and match.group(1) else pdf_path.stem)[:40]
 
 
 def test_single_pdf(pdf_path: Path, test_name: str):
@@ -36,91 +63,31 @@ def test_single_pdf(pdf_path: Path, test_name: str):
         
         # Collect question numbers
         question_numbers = set()
-        question_types = {}
+        question_types = Counter(q.get('type') for q in parsed_questions)
         
-        for q in parsed_questions:
-            q_type = q.get('type')
-            question_types[q_type] = question_types.get(q_type, 0) + 1
-            
-            if q_type == 'single_choice':
-                num = q.get('number')
-                if num:
-                    if num in question_numbers:
-                        return {
-                            'name': test_name,
-                            'status': 'FAILED',
-                            'reason': f'Duplicate question number {num} in {q_type}'
-                        }
-                    question_numbers.add(num)
-            elif q_type in ['paragraph_matching', 'yes_no_not_given', 'matching_features', 
-                            'matching_sentence_endings', 'matching_headings']:
-                statements = q.get('statements', []) or q.get('sentence_beginnings', []) or q.get('paragraphs', [])
-                for stmt in statements:
-                    num = stmt.get('number')
-                    if num:
-                        if num in question_numbers:
-                            return {
-                                'name': test_name,
-                                'status': 'FAILED',
-                                'reason': f'Duplicate question number {num} in {q_type}'
-                            }
-                        question_numbers.add(num)
-            elif q_type == 'fill_blank':
-                num = q.get('number')
-                if num:
-                    if num in question_numbers:
-                        return {
-                            'name': test_name,
-                            'status': 'FAILED',
-                            'reason': f'Duplicate question number {num} in {q_type}'
-                        }
-                    question_numbers.add(num)
-            elif q_type == 'summary_completion':
-                for num in q.get('blanks', []):
-                    if num in question_numbers:
-                        return {
-                            'name': test_name,
-                            'status': 'FAILED',
-                            'reason': f'Duplicate question number {num} in {q_type}'
-                        }
-                    question_numbers.add(num)
-            elif q_type == 'short_answer':
-                num = q.get('number')
-                if num:
-                    if num in question_numbers:
-                        return {
-                            'name': test_name,
-                            'status': 'FAILED',
-                            'reason': f'Duplicate question number {num} in {q_type}'
-                        }
-                    question_numbers.add(num)
+        for num, q_type in iter_question_numbers(parsed_questions):
+            if not num:
+                continue
+            if num in question_numbers:
+                return {
+                    'name': test_name,
+                    'status': 'FAILED',
+                    'reason': f'Duplicate question number {num} in {q_type}'
+                }
+            question_numbers.add(num)
         
         # Check for standalone subheadings
-        standalone_subheadings = []
-        subheading_keywords = [
-            'description of the study',
-            'methodological issues',
-            'lessons to consider',
-            'conclusion',
-            'introduction',
-            'background',
-            'discussion',
-            'results',
-            'methods',
-        ]
-        
-        for para in structured_passage['paragraphs']:
-            text = para['text'].lower().strip()
-            if len(para['text']) < 50:
-                for keyword in subheading_keywords:
-                    if text == keyword:
-                        standalone_subheadings.append(para['text'])
+        # Two examples are enough for the report, so the scan stops there
+        standalone_subheadings = list(islice((
+            para['text'] for para in structured_passage['paragraphs']
+            if len(para['text']) < 50 and para['text'].lower().strip() in STANDALONE_SUBHEADINGS
+        ), 2))
         
         if standalone_subheadings:
             return {
                 'name': test_name,
                 'status': 'FAILED',
-                'reason': f'Found {len(standalone_subheadings)} standalone subheadings: {standalone_subheadings[:2]}'
+                'reason': f'Found standalone subheadings: {standalone_subheadings}'
             }
         
         return {
@@ -128,7 +95,7 @@ def test_single_pdf(pdf_path: Path, test_name: str):
             'status': 'PASSED',
             'question_count': len(question_numbers),
             'paragraph_count': len(structured_passage['paragraphs']),
-            'question_types': question_types,
+            'question_types': dict(question_types),
         }
         
     except Exception as e:
@@ -139,67 +106,59 @@ def test_single_pdf(pdf_path: Path, test_name: str):
         }
 
 
+def format_result(pdf_file: str, test_name: str, result: Dict[str, Any]) -> str:
+    """Report block for one PDF, written out in a single call."""
+    lines = [f"\nTesting: {test_name}", f"  File: {pdf_file[:60]}..."]
+    if result['status'] == 'PASSED':
+        lines.append(f"  ✅ PASS - {result['question_count']} questions, {result['paragraph_count']} paragraphs")
+        if result.get('question_types'):
+            types_str = ', '.join(f"{k}:{v}" for k, v in sorted(result['question_types'].items()))
+            lines.append(f"     Types: {types_str}")
+    elif result['status'] == 'SKIPPED':
+        lines.append(f"  ⚠️  SKIPPED - {result['reason']}")
+    elif result['status'] == 'FAILED':
+        lines.append(f"  ❌ FAILED - {result['reason']}")
+    elif result['status'] == 'ERROR':
+        lines.append(f"  ❌ ERROR - {result['reason']}")
+    return '\n'.join(lines) + '\n'
+
+
 def run_all_pdf_tests():
     """Test ALL available PDFs in the repository."""
+    base_path = Path(__file__).parent / "pdf/ZYZ老师文章合集（至10.6）[164篇]"
+    
+    # Test ALL PDFs in the directory, in collection order
+    test_cases = [(pdf_path.name, pdf_test_name(pdf_path)) for pdf_path in discover_pdfs(base_path)]
+    
     print("\n" + "="*80)
-    print("COMPREHENSIVE PDF TESTING - Testing ALL 20 PDF Files")
+    print(f"COMPREHENSIVE PDF TESTING - Testing ALL {len(test_cases)} PDF Files")
     print("="*80)
     
-    base_path = Path(__file__).parent / "pdf/ZYZ老师文章合集（至10.6）[164篇]"
-    
-    # Test ALL PDFs in the directory
-    test_cases = [
-        ("60. P3 - A closer examination of a study on verbal and non-verbal messages 语言表达研究【高】.pdf", "Verbal Messages"),
-        ("61. P3 - Book Review The Discovery of Slowness 富兰克林(慢的发现)【高】.pdf", "Book Review"),
-        ("65. P3 - Does class size matter 课堂规模【高】.pdf", "Class Size"),
-        ("66. P3 - Elephant Communication 大象交流【高】.pdf", "Elephant Communication"),
-        ("67. P3 - Flower Power 鲜花的力量(花之力)【高】.pdf", "Flower Power"),
-        ("70. P3 - Insect-inspired robots 昆虫机器人【高】.pdf", "Insect Robots"),
-        ("76. P3 - Living dunes 流动沙丘【高】.pdf", "Living Dunes"),
-        ("78. P3 (仅原文无题) - Music Language We All Speak 音乐语言【高】.pdf", "Music Language"),
-        ("81. P3 - Robert Louis Stevenson 苏格兰作家【高】.pdf", "Robert Louis Stevenson"),
-        ("82. P3 - Some views on the use of headphones 耳机使用【高】.pdf", "Headphones"),
-        ("84. P3 - The Analysis of Fear 猴子恐惧实验【高】.pdf", "Fear Analysis"),
-        ("89. P3 - The Fruit Book 果实之书【高】.pdf", "Fruit Book"),
-        ("91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】.pdf", "Margaret Mahy"),
-        ("92. P3 - The Pirahã people of Brazil  巴西皮拉罕部落语言【高】.pdf", "Pirahã"),
-        ("101. P3 - Yawning 打呵欠【高】.pdf", "Yawning"),
-        ("111. P3 - Whale Culture 鲸鱼文化【高】.pdf", "Whale Culture"),
-        ("123. P3 - Images and Places 风景与印记 【高】.pdf", "Images and Places"),
-        ("127. P3 - Science and Filmmaking 电影科学(CGI)【高】.pdf", "Science and Filmmaking"),
-        ("130. P3 - Tasmania's Museum of Old and New Art 塔斯马尼亚古今艺术博物馆 MONA【高】.pdf", "Tasmania MONA"),
-        ("147. P3 - Movement Underwater 水下运动【高】.pdf", "Movement Underwater"),
-    ]
+    if not test_cases:
+        print(f"\n⚠️  No PDF files found in {base_path}, skipping")
+        return 0
     
-    results = []
-    for pdf_file, test_name in test_cases:
-        pdf_path = base_path / pdf_file
-        print(f"\nTesting: {test_name}")
-        print(f"  File: {pdf_file[:60]}...")
-        result = test_single_pdf(pdf_path, test_name)
-        results.append(result)
-        
-        if result['status'] == 'PASSED':
-            print(f"  ✅ PASS - {result['question_count']} questions, {result['paragraph_count']} paragraphs")
-            if result.get('question_types'):
-                types_str = ', '.join(f"{k}:{v}" for k, v in sorted(result['question_types'].items()))
-                print(f"     Types: {types_str}")
-        elif result['status'] == 'SKIPPED':
-            print(f"  ⚠️  SKIPPED - {result['reason']}")
-        elif result['status'] == 'FAILED':
-            print(f"  ❌ FAILED - {result['reason']}")
-        elif result['status'] == 'ERROR':
-            print(f"  ❌ ERROR - {result['reason']}")
+    # PDFs are independent and CPU-bound, so they are tested in worker
+    # processes; map() returns results in test_cases order for the report
+    pdf_paths = [base_path / pdf_file for pdf_file, _ in test_cases]
+    test_names = [test_name for _, test_name in test_cases]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        pdf_results = executor.map(test_single_pdf, pdf_paths, test_names)
+        results = []
+        for (pdf_file, test_name), result in zip(test_cases, pdf_results):
+            results.append(result)
+            sys.stdout.write(format_result(pdf_file, test_name, result))
     
     # Summary
     print("\n" + "="*80)
     print("COMPREHENSIVE TEST SUMMARY")
     print("="*80)
     
-    passed = sum(1 for r in results if r['status'] == 'PASSED')
-    failed = sum(1 for r in results if r['status'] == 'FAILED')
-    error = sum(1 for r in results if r['status'] == 'ERROR')
-    skipped = sum(1 for r in results if r['status'] == 'SKIPPED')
+    status_counts = Counter(r['status'] for r in results)
+    passed = status_counts['PASSED']
+    failed = status_counts['FAILED']
+    error = status_counts['ERROR']
+    skipped = status_counts['SKIPPED']
     total = len(results)
     
     print(f"\n✅ Passed:  {passed}/{total}")
@@ -223,7 +182,7 @@ def run_all_pdf_tests():
     print(f"\n📊 Success rate: {success_rate:.1f}% ({passed}/{total - skipped} non-skipped tests)")
     
     if failed == 0 and error == 0:
-        print("\n🎉 ALL 20 PDF FILES PASSED! The fixes work correctly across the entire collection.")
+        print(f"\n🎉 ALL {total} PDF FILES PASSED! The fixes work correctly across the entire collection.")
         return 0
     else:
         print(f"\n⚠️  {failed + error} test(s) failed. Please review the issues above.")
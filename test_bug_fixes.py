@@ -8,7 +8,10 @@ This test verifies that:
 2. Subheadings in passages are merged with their content, not treated as separate paragraphs
 3. Question numbers are correctly extracted from MCQ questions
 """
+import ast
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
@@ -20,10 +23,32 @@ from app import (
     structure_passage,
     collect_passage_blocks,
     parse_questions,
+    find_question_headings,
     parse_single_choice,
     parse_yes_no_not_given,
     parse_matching_sentence_endings,
 )
+from test_helpers import iter_question_numbers
+
+# Subheadings in the verbal/non-verbal messages PDF, and a matcher for a
+# paragraph that starts with one of them
+SUBHEADINGS = (
+    'description of the study',
+    'methodological issues',
+    'lessons to consider',
+    'conclusion',
+)
+SUBHEADING_PREFIX_RE = re.compile('|'.join(re.escape(s) for s in SUBHEADINGS), re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _extract_cached(path: str, mtime_ns: int):
+    return extract_text_and_blocks(path)
+
+
+def extract_pdf(pdf_path: Path):
+    """extract_text_and_blocks() memoized per file and modification time, so tests sharing a PDF read it once."""
+    return _extract_cached(str(pdf_path), pdf_path.stat().st_mtime_ns)
 
 
 def test_no_duplicate_question_numbers():
@@ -39,42 +64,24 @@ def test_no_duplicate_question_numbers():
         print("⚠️  Test PDF not found, skipping test")
         return True
     
-    full_text, blocks = extract_text_and_blocks(str(pdf_path))
+    full_text, blocks = extract_pdf(pdf_path)
     passage, question_text = split_passage_questions(full_text)
     parsed_questions = parse_questions(question_text, blocks)
     
-    # Collect all question numbers
-    question_numbers = []
-    for q in parsed_questions:
-        q_type = q.get('type')
-        if q_type == 'single_choice':
-            question_numbers.append((q.get('number'), q_type))
-        elif q_type in ['paragraph_matching', 'yes_no_not_given', 'matching_features', 
-                        'matching_sentence_endings', 'matching_headings']:
-            statements = q.get('statements', []) or q.get('sentence_beginnings', []) or q.get('paragraphs', [])
-            for stmt in statements:
-                question_numbers.append((stmt.get('number'), q_type))
-        elif q_type == 'fill_blank':
-            question_numbers.append((q.get('number'), q_type))
-        elif q_type == 'summary_completion':
-            for num in q.get('blanks', []):
-                question_numbers.append((num, q_type))
-        elif q_type == 'short_answer':
-            question_numbers.append((q.get('number'), q_type))
-    
-    # Check for duplicates
+    # Check for duplicates across all question numbers
     seen = {}
     duplicates = []
-    for num, q_type in question_numbers:
-        if num in seen:
-            duplicates.append((num, seen[num], q_type))
-            print(f"❌ DUPLICATE: Question {num} found in both {seen[num]} and {q_type}")
+    for num, q_type in iter_question_numbers(parsed_questions):
+        prev_type = seen.get(num)
+        if prev_type is not None:
+            duplicates.append((num, prev_type, q_type))
+            print(f"❌ DUPLICATE: Question {num} found in both {prev_type} and {q_type}")
         else:
             seen[num] = q_type
     
     if not duplicates:
         print(f"✅ PASS: No duplicate question numbers found")
-        print(f"   Total questions parsed: {len(question_numbers)}")
+        print(f"   Total questions parsed: {len(seen)}")
         return True
     else:
         print(f"❌ FAIL: Found {len(duplicates)} duplicate question numbers")
@@ -94,28 +101,19 @@ def test_subheading_merging():
         print("⚠️  Test PDF not found, skipping test")
         return True
     
-    full_text, blocks = extract_text_and_blocks(str(pdf_path))
+    full_text, blocks = extract_pdf(pdf_path)
     passage, question_text = split_passage_questions(full_text)
     passage_blocks = collect_passage_blocks(passage, blocks)
     structured_passage = structure_passage(passage, passage_blocks)
     
     # Check that common subheadings are not standalone paragraphs
     standalone_subheadings = []
-    subheading_keywords = [
-        'description of the study',
-        'methodological issues',
-        'lessons to consider',
-        'conclusion',
-    ]
     
     for i, para in enumerate(structured_passage['paragraphs']):
-        text = para['text'].lower()
-        # Check if this is a very short paragraph that matches a subheading pattern
-        if len(para['text']) < 50:
-            for keyword in subheading_keywords:
-                if keyword in text and text.strip() == keyword:
-                    standalone_subheadings.append((i, para['text']))
-                    print(f"❌ STANDALONE SUBHEADING: Paragraph {i}: '{para['text']}'")
+        # Check if this is a very short paragraph that is exactly a subheading
+        if len(para['text']) < 50 and para['text'].lower().strip() in SUBHEADINGS:
+            standalone_subheadings.append((i, para['text']))
+            print(f"❌ STANDALONE SUBHEADING: Paragraph {i}: '{para['text']}'")
     
     if not standalone_subheadings:
         print(f"✅ PASS: No standalone subheadings found")
@@ -124,12 +122,11 @@ def test_subheading_merging():
         # Verify that subheadings are merged
         merged_count = 0
         for para in structured_passage['paragraphs']:
-            for keyword in subheading_keywords:
-                if para['text'].lower().startswith(keyword):
-                    # Check if there's content after the subheading
-                    if len(para['text']) > len(keyword) + 10:
-                        merged_count += 1
-                        print(f"   ✓ Subheading merged: '{para['text'][:60]}...'")
+            match = SUBHEADING_PREFIX_RE.match(para['text'])
+            # Check if there's content after the subheading
+            if match and len(para['text']) > match.end() + 10:
+                merged_count += 1
+                print(f"   ✓ Subheading merged: '{para['text'][:60]}...'")
         
         if merged_count > 0:
             print(f"   Found {merged_count} properly merged subheadings")
@@ -153,7 +150,7 @@ def test_mcq_number_extraction():
         print("⚠️  Test PDF not found, skipping test")
         return True
     
-    full_text, blocks = extract_text_and_blocks(str(pdf_path))
+    full_text, blocks = extract_pdf(pdf_path)
     passage, question_text = split_passage_questions(full_text)
     mcqs = parse_single_choice(question_text)
     
@@ -216,7 +213,10 @@ C future
 D time
 """
     
-    sentence_endings = parse_matching_sentence_endings(test_text)
+    # Share the heading scan with the section parser the way parse_questions() does;
+    # the Yes/No parser sections on line-anchored headings of its own
+    heading_matches = find_question_headings(test_text)
+    sentence_endings = parse_matching_sentence_endings(test_text, heading_matches)
     yes_no = parse_yes_no_not_given(test_text)
     
     print(f"   Sentence endings found: {len(sentence_endings)}")
@@ -233,6 +233,38 @@ D time
         return False
 
 
+def test_regex_precompiled():
+    """Test that app.py compiles its regexes at module level, not inside functions."""
+    print("\n" + "="*80)
+    print("TEST 5: Regexes Precompiled at Module Level")
+    print("="*80)
+    
+    source_path = Path(__file__).parent / "app.py"
+    tree = ast.parse(source_path.read_text(encoding='utf-8'))
+    
+    # Any re.<function>(...) call inside a function body compiles (or looks up)
+    # a pattern on every call; (node, enclosing function name) pairs are walked
+    inline_calls = []
+    pending = [(tree, None)]
+    while pending:
+        node, func_name = pending.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            func_name = node.name
+        elif (func_name and isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name) and node.func.value.id == 're'):
+            inline_calls.append((node.lineno, func_name, node.func.attr))
+        pending.extend((child, func_name) for child in ast.iter_child_nodes(node))
+    
+    for lineno, func_name, attr in sorted(inline_calls):
+        print(f"❌ INLINE REGEX: re.{attr}() in {func_name}() at app.py:{lineno}")
+    
+    if inline_calls:
+        print(f"❌ FAIL: Found {len(inline_calls)} regex calls inside functions")
+    assert not inline_calls, f"Found {len(inline_calls)} regex calls inside functions in app.py"
+    print(f"✅ PASS: All regexes in app.py are precompiled at module level")
+    return True
+
+
 def run_all_tests():
     """Run all tests and report results."""
     print("\n" + "="*80)
@@ -244,6 +276,7 @@ def run_all_tests():
         ("Subheading Merging", test_subheading_merging),
         ("MCQ Number Extraction", test_mcq_number_extraction),
         ("Yes/No vs Sentence Endings", test_yes_no_vs_sentence_endings),
+        ("Regexes Precompiled", test_regex_precompiled),
     ]
     
     results = []
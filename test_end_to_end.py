@@ -3,6 +3,7 @@
 End-to-end test demonstrating PDF processing with all question types
 """
 import sys
+from collections import Counter
 from pathlib import Path
 from app import (
     split_passage_questions,
@@ -233,136 +234,139 @@ Write your answers in boxes 38-40 on your answer sheet.
 40 Type of memory for facts and events: __________
 """
 
-print("="*70)
-print("END-TO-END TEST: IELTS READING PASSAGE PROCESSING")
-print("="*70)
-print("\nProcessing realistic IELTS reading test content...\n")
-
-# Step 1: Split passage and questions
-print("Step 1: Splitting passage from questions...")
-passage_text, questions_text = split_passage_questions(sample_ielts_content)
-print(f"  ✓ Passage: {len(passage_text)} characters")
-print(f"  ✓ Questions: {len(questions_text)} characters")
-
-# Step 2: Structure the passage
-print("\nStep 2: Structuring passage...")
-structured_passage = structure_passage(passage_text)
-print(f"  ✓ Title: {structured_passage.get('title', 'N/A')}")
-print(f"  ✓ Paragraphs: {len(structured_passage.get('paragraphs', []))}")
-if structured_passage.get('paragraphs'):
-    for p in structured_passage['paragraphs'][:3]:
-        if p.get('letter'):
-            print(f"    - Paragraph {p['letter']}: {p['text'][:60]}...")
-
-# Step 3: Parse questions
-print("\nStep 3: Parsing questions...")
-parsed_questions = parse_questions(questions_text, blocks=None)
-print(f"  ✓ Total question groups parsed: {len(parsed_questions)}")
-
-# Step 4: Display detailed results
-print("\n" + "="*70)
-print("DETAILED RESULTS BY QUESTION TYPE")
-print("="*70)
-
-question_type_names = {
-    'matching_headings': 'Matching Headings',
-    'yes_no_not_given': 'True/False/Not Given or Yes/No/Not Given',
-    'short_answer': 'Short-Answer Questions',
-    'fill_blank': 'Sentence Completion',
-    'paragraph_matching': 'Matching Information',
-    'matching_features': 'Matching Features',
-    'matching_sentence_endings': 'Matching Sentence Endings',
-    'diagram_label_completion': 'Diagram Label Completion',
-    'summary_completion': 'Summary Completion',
-    'single_choice': 'Multiple Choice Questions'
-}
-
-for idx, q in enumerate(parsed_questions, 1):
-    q_type = q.get('type', 'unknown')
-    type_name = question_type_names.get(q_type, q_type)
+
+def main():
+    print("="*70)
+    print("END-TO-END TEST: IELTS READING PASSAGE PROCESSING")
+    print("="*70)
+    print("\nProcessing realistic IELTS reading test content...\n")
+
+    # Step 1: Split passage and questions
+    print("Step 1: Splitting passage from questions...")
+    passage_text, questions_text = split_passage_questions(sample_ielts_content)
+    print(f"  ✓ Passage: {len(passage_text)} characters")
+    print(f"  ✓ Questions: {len(questions_text)} characters")
+
+    # Step 2: Structure the passage
+    print("\nStep 2: Structuring passage...")
+    structured_passage = structure_passage(passage_text)
+    print(f"  ✓ Title: {structured_passage.get('title', 'N/A')}")
+    print(f"  ✓ Paragraphs: {len(structured_passage.get('paragraphs', []))}")
+    if structured_passage.get('paragraphs'):
+        for p in structured_passage['paragraphs'][:3]:
+            if p.get('letter'):
+                print(f"    - Paragraph {p['letter']}: {p['text'][:60]}...")
+
+    # Step 3: Parse questions
+    print("\nStep 3: Parsing questions...")
+    parsed_questions = parse_questions(questions_text, blocks=None)
+    print(f"  ✓ Total question groups parsed: {len(parsed_questions)}")
+
+    # Step 4: Display detailed results
+    print("\n" + "="*70)
+    print("DETAILED RESULTS BY QUESTION TYPE")
+    print("="*70)
+
+    question_type_names = {
+        'matching_headings': 'Matching Headings',
+        'yes_no_not_given': 'True/False/Not Given or Yes/No/Not Given',
+        'short_answer': 'Short-Answer Questions',
+        'fill_blank': 'Sentence Completion',
+        'paragraph_matching': 'Matching Information',
+        'matching_features': 'Matching Features',
+        'matching_sentence_endings': 'Matching Sentence Endings',
+        'diagram_label_completion': 'Diagram Label Completion',
+        'summary_completion': 'Summary Completion',
+        'single_choice': 'Multiple Choice Questions'
+    }
+
+    for idx, q in enumerate(parsed_questions, 1):
+        q_type = q.get('type', 'unknown')
+        type_name = question_type_names.get(q_type, q_type)
     
-    print(f"\n{idx}. {type_name}")
-    print("   " + "-"*60)
+        print(f"\n{idx}. {type_name}")
+        print("   " + "-"*60)
     
-    if q_type == 'matching_headings':
-        print(f"   Title: {q.get('title', '')}")
-        print(f"   Headings available: {len(q.get('headings', []))}")
-        if q.get('headings'):
-            for h in q['headings'][:3]:
-                print(f"     • {h['key']} - {h['text'][:50]}...")
-        print(f"   Paragraphs to match: {len(q.get('paragraphs', []))}")
+        if q_type == 'matching_headings':
+            print(f"   Title: {q.get('title', '')}")
+            print(f"   Headings available: {len(q.get('headings', []))}")
+            if q.get('headings'):
+                for h in q['headings'][:3]:
+                    print(f"     • {h['key']} - {h['text'][:50]}...")
+            print(f"   Paragraphs to match: {len(q.get('paragraphs', []))}")
         
-    elif q_type in ['yes_no_not_given']:
-        print(f"   Title: {q.get('title', '')}")
-        print(f"   Statements: {len(q.get('statements', []))}")
-        print(f"   Options: {', '.join(q.get('options', []))}")
-        if q.get('statements'):
-            for s in q['statements'][:2]:
-                print(f"     {s['number']}. {s['text'][:60]}...")
+        elif q_type in ['yes_no_not_given']:
+            print(f"   Title: {q.get('title', '')}")
+            print(f"   Statements: {len(q.get('statements', []))}")
+            print(f"   Options: {', '.join(q.get('options', []))}")
+            if q.get('statements'):
+                for s in q['statements'][:2]:
+                    print(f"     {s['number']}. {s['text'][:60]}...")
     
-    elif q_type == 'paragraph_matching':
-        print(f"   Title: {q.get('title', '')}")
-        print(f"   Statements: {len(q.get('statements', []))}")
-        print(f"   Paragraph options: {', '.join(q.get('options', []))}")
-        if q.get('statements'):
-            for s in q['statements'][:2]:
-                print(f"     {s['number']}. {s['text'][:60]}...")
+        elif q_type == 'paragraph_matching':
+            print(f"   Title: {q.get('title', '')}")
+            print(f"   Statements: {len(q.get('statements', []))}")
+            print(f"   Paragraph options: {', '.join(q.get('options', []))}")
+            if q.get('statements'):
+                for s in q['statements'][:2]:
+                    print(f"     {s['number']}. {s['text'][:60]}...")
     
-    elif q_type == 'matching_features':
-        print(f"   Title: {q.get('title', '')}")
-        print(f"   Features: {len(q.get('features', []))}")
-        if q.get('features'):
-            for f in q['features'][:3]:
-                print(f"     {f['key']} - {f['text']}")
-        print(f"   Statements to match: {len(q.get('statements', []))}")
+        elif q_type == 'matching_features':
+            print(f"   Title: {q.get('title', '')}")
+            print(f"   Features: {len(q.get('features', []))}")
+            if q.get('features'):
+                for f in q['features'][:3]:
+                    print(f"     {f['key']} - {f['text']}")
+            print(f"   Statements to match: {len(q.get('statements', []))}")
     
-    elif q_type == 'matching_sentence_endings':
-        print(f"   Title: {q.get('title', '')}")
-        print(f"   Sentence beginnings: {len(q.get('sentence_beginnings', []))}")
-        print(f"   Endings available: {len(q.get('endings', []))}")
-        if q.get('sentence_beginnings'):
-            for sb in q['sentence_beginnings'][:2]:
-                print(f"     {sb['number']}. {sb['text'][:50]}...")
+        elif q_type == 'matching_sentence_endings':
+            print(f"   Title: {q.get('title', '')}")
+            print(f"   Sentence beginnings: {len(q.get('sentence_beginnings', []))}")
+            print(f"   Endings available: {len(q.get('endings', []))}")
+            if q.get('sentence_beginnings'):
+                for sb in q['sentence_beginnings'][:2]:
+                    print(f"     {sb['number']}. {sb['text'][:50]}...")
     
-    elif q_type == 'short_answer':
-        print(f"   Question {q.get('number', '')}: {q.get('text', '')[:60]}...")
-        print(f"   Word limit: {q.get('word_limit', 'N/A')}")
+        elif q_type == 'short_answer':
+            print(f"   Question {q.get('number', '')}: {q.get('text', '')[:60]}...")
+            print(f"   Word limit: {q.get('word_limit', 'N/A')}")
     
-    elif q_type == 'fill_blank':
-        print(f"   Question {q.get('number', '')}: {q.get('text', '')[:60]}...")
+        elif q_type == 'fill_blank':
+            print(f"   Question {q.get('number', '')}: {q.get('text', '')[:60]}...")
     
-    elif q_type == 'diagram_label_completion':
-        print(f"   Title: {q.get('title', '')}")
-        print(f"   Labels to complete: {len(q.get('labels', []))}")
-        if q.get('labels'):
-            for l in q['labels'][:3]:
-                print(f"     {l['number']}. {l['text'][:50]}...")
+        elif q_type == 'diagram_label_completion':
+            print(f"   Title: {q.get('title', '')}")
+            print(f"   Labels to complete: {len(q.get('labels', []))}")
+            if q.get('labels'):
+                for l in q['labels'][:3]:
+                    print(f"     {l['number']}. {l['text'][:50]}...")
     
-    elif q_type == 'summary_completion':
-        print(f"   Blanks to fill: {len(q.get('blanks', []))}")
-        print(f"   Word bank options: {len(q.get('options', []))}")
-
-print("\n" + "="*70)
-print("TEST SUMMARY")
-print("="*70)
-
-# Count question types
-type_counts = {}
-for q in parsed_questions:
-    q_type = q.get('type', 'unknown')
-    type_counts[q_type] = type_counts.get(q_type, 0) + 1
-
-print("\nQuestion types successfully recognized:")
-for q_type, count in sorted(type_counts.items()):
-    type_name = question_type_names.get(q_type, q_type)
-    print(f"  ✓ {type_name}: {count} section(s)")
-
-print("\n" + "="*70)
-print("✓ END-TO-END TEST PASSED!")
-print("="*70)
-print("\nThe application successfully:")
-print("  • Split passage from questions")
-print("  • Structured passage with paragraph lettering")
-print(f"  • Recognized {len(parsed_questions)} question groups")
-print(f"  • Identified {len(type_counts)} different question types")
-print("\nAll parsers are working correctly with realistic IELTS content!")
+        elif q_type == 'summary_completion':
+            print(f"   Blanks to fill: {len(q.get('blanks', []))}")
+            print(f"   Word bank options: {len(q.get('options', []))}")
+
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+
+    # Count question types
+    type_counts = Counter(q.get('type', 'unknown') for q in parsed_questions)
+
+    print("\nQuestion types successfully recognized:")
+    for q_type, count in sorted(type_counts.items()):
+        type_name = question_type_names.get(q_type, q_type)
+        print(f"  ✓ {type_name}: {count} section(s)")
+
+    print("\n" + "="*70)
+    print("✓ END-TO-END TEST PASSED!")
+    print("="*70)
+    print("\nThe application successfully:")
+    print("  • Split passage from questions")
+    print("  • Structured passage with paragraph lettering")
+    print(f"  • Recognized {len(parsed_questions)} question groups")
+    print(f"  • Identified {len(type_counts)} different question types")
+    print("\nAll parsers are working correctly with realistic IELTS content!")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,23 +3,28 @@
 Extended test to validate fixes with MORE PDF files.
 Tests 10+ different PDFs to ensure robustness across various formats.
 """
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import AbstractSet, Any, Dict, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app import (
-    extract_text_and_blocks,
-    split_passage_questions,
-    structure_passage,
-    collect_passage_blocks,
-    parse_questions,
-)
+from batch_test_pdfs import parse_pdf_cached
+from test_helpers import STANDALONE_SUBHEADINGS, iter_question_numbers
 
 
-def test_single_pdf(pdf_path: Path, test_name: str):
-    """Test a single PDF and return results."""
-    if not pdf_path.exists():
+def test_single_pdf(pdf_path: Path, test_name: str, available: Optional[AbstractSet[str]] = None):
+    """
+    Test a single PDF and return results.
+    available, when given, holds the file names in pdf_path's directory and
+    replaces the per-file existence check.
+    """
+    found = pdf_path.name in available if available is not None else pdf_path.exists()
+    if not found:
         return {
             'name': test_name,
             'status': 'SKIPPED',
@@ -27,95 +32,32 @@ def test_single_pdf(pdf_path: Path, test_name: str):
         }
     
     try:
-        # Extract and parse
-        full_text, blocks = extract_text_and_blocks(str(pdf_path))
-        passage, question_text = split_passage_questions(full_text)
-        passage_blocks = collect_passage_blocks(passage, blocks)
-        structured_passage = structure_passage(passage, passage_blocks)
-        parsed_questions = parse_questions(question_text, blocks)
+        # Extract and parse; repeat runs reuse batch_test_pdfs' on-disk cache,
+        # which is keyed by the PDF bytes and the parser sources
+        structured_passage, parsed_questions = parse_pdf_cached(pdf_path)
         
         # Collect question numbers
         question_numbers = set()
-        question_types = {}
+        question_types = Counter(q.get('type') for q in parsed_questions)
         
-        for q in parsed_questions:
-            q_type = q.get('type')
-            question_types[q_type] = question_types.get(q_type, 0) + 1
-            
-            if q_type == 'single_choice':
-                num = q.get('number')
-                if num:
-                    if num in question_numbers:
-                        return {
-                            'name': test_name,
-                            'status': 'FAILED',
-                            'reason': f'Duplicate question number {num} in {q_type}'
-                        }
-                    question_numbers.add(num)
-            elif q_type in ['paragraph_matching', 'yes_no_not_given', 'matching_features', 
-                            'matching_sentence_endings', 'matching_headings']:
-                statements = q.get('statements', []) or q.get('sentence_beginnings', []) or q.get('paragraphs', [])
-                for stmt in statements:
-                    num = stmt.get('number')
-                    if num:
-                        if num in question_numbers:
-                            return {
-                                'name': test_name,
-                                'status': 'FAILED',
-                                'reason': f'Duplicate question number {num} in {q_type}'
-                            }
-                        question_numbers.add(num)
-            elif q_type == 'fill_blank':
-                num = q.get('number')
-                if num:
-                    if num in question_numbers:
-                        return {
-                            'name': test_name,
-                            'status': 'FAILED',
-                            'reason': f'Duplicate question number {num} in {q_type}'
-                        }
-                    question_numbers.add(num)
-            elif q_type == 'summary_completion':
-                for num in q.get('blanks', []):
-                    if num in question_numbers:
-                        return {
-                            'name': test_name,
-                            'status': 'FAILED',
-                            'reason': f'Duplicate question number {num} in {q_type}'
-                        }
-                    question_numbers.add(num)
-            elif q_type == 'short_answer':
-                num = q.get('number')
-                if num:
-                    if num in question_numbers:
-                        return {
-                            'name': test_name,
-                            'status': 'FAILED',
-                            'reason': f'Duplicate question number {num} in {q_type}'
-                        }
-                    question_numbers.add(num)
+        for num, q_type in iter_question_numbers(parsed_questions):
+            if not num:
+                continue
+            if num in question_numbers:
+                return {
+                    'name': test_name,
+                    'status': 'FAILED',
+                    'reason': f'Duplicate question number {num} in {q_type}'
+                }
+            question_numbers.add(num)
         
         # Check for standalone subheadings
-        standalone_subheadings = []
-        subheading_keywords = [
-            'description of the study',
-            'methodological issues',
-            'lessons to consider',
-            'conclusion',
-            'introduction',
-            'background',
-            'discussion',
-            'results',
-            'methods',
+        # Long paragraphs are ruled out before any lower-casing
+        standalone_subheadings = [
+            para['text'] for para in structured_passage['paragraphs']
+            if len(para['text']) < 50 and para['text'].lower().strip() in STANDALONE_SUBHEADINGS
         ]
         
-        for para in structured_passage['paragraphs']:
-            text = para['text'].lower().strip()
-            if len(para['text']) < 50:
-                for keyword in subheading_keywords:
-                    if text == keyword:
-                        standalone_subheadings.append(para['text'])
-        
         if standalone_subheadings:
             return {
                 'name': test_name,
@@ -128,7 +70,7 @@ def test_single_pdf(pdf_path: Path, test_name: str):
             'status': 'PASSED',
             'question_count': len(question_numbers),
             'paragraph_count': len(structured_passage['paragraphs']),
-            'question_types': question_types,
+            'question_types': dict(question_types),
         }
         
     except Exception as e:
@@ -139,6 +81,23 @@ def test_single_pdf(pdf_path: Path, test_name: str):
         }
 
 
+def format_result(pdf_file: str, test_name: str, result: Dict[str, Any]) -> str:
+    """Report block for one PDF, written out in a single call."""
+    lines = [f"\nTesting: {test_name}", f"  File: {pdf_file}"]
+    if result['status'] == 'PASSED':
+        lines.append(f"  ✅ PASS - {result['question_count']} questions, {result['paragraph_count']} paragraphs")
+        if result.get('question_types'):
+            types_str = ', '.join(f"{k}:{v}" for k, v in sorted(result['question_types'].items()))
+            lines.append(f"  Question types: {types_str}")
+    elif result['status'] == 'SKIPPED':
+        lines.append(f"  ⚠️  SKIPPED - {result['reason']}")
+    elif result['status'] == 'FAILED':
+        lines.append(f"  ❌ FAILED - {result['reason']}")
+    elif result['status'] == 'ERROR':
+        lines.append(f"  ❌ ERROR - {result['reason']}")
+    return '\n'.join(lines) + '\n'
+
+
 def run_extended_tests():
     """Test multiple PDFs to ensure robustness."""
     print("\n" + "="*80)
@@ -166,35 +125,34 @@ def run_extended_tests():
         ("81. P3 - Robert Louis Stevenson 苏格兰作家【高】.pdf", "Robert Louis Stevenson"),
     ]
     
-    results = []
-    for pdf_file, test_name in test_cases:
-        pdf_path = base_path / pdf_file
-        print(f"\nTesting: {test_name}")
-        print(f"  File: {pdf_file}")
-        result = test_single_pdf(pdf_path, test_name)
-        results.append(result)
-        
-        if result['status'] == 'PASSED':
-            print(f"  ✅ PASS - {result['question_count']} questions, {result['paragraph_count']} paragraphs")
-            if result.get('question_types'):
-                types_str = ', '.join(f"{k}:{v}" for k, v in sorted(result['question_types'].items()))
-                print(f"  Question types: {types_str}")
-        elif result['status'] == 'SKIPPED':
-            print(f"  ⚠️  SKIPPED - {result['reason']}")
-        elif result['status'] == 'FAILED':
-            print(f"  ❌ FAILED - {result['reason']}")
-        elif result['status'] == 'ERROR':
-            print(f"  ❌ ERROR - {result['reason']}")
+    # One directory scan instead of a stat() per test case; scandir() entries
+    # carry their file type, so is_file() needs no extra syscall
+    available = set()
+    if base_path.is_dir():
+        with os.scandir(base_path) as entries:
+            available = {entry.name for entry in entries if entry.is_file()}
+    
+    # PDFs are independent and CPU-bound, so they are tested in worker
+    # processes; map() returns results in test_cases order for the report
+    pdf_paths = [base_path / pdf_file for pdf_file, _ in test_cases]
+    test_names = [test_name for _, test_name in test_cases]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        pdf_results = executor.map(test_single_pdf, pdf_paths, test_names, repeat(available))
+        results = []
+        for (pdf_file, test_name), result in zip(test_cases, pdf_results):
+            results.append(result)
+            sys.stdout.write(format_result(pdf_file, test_name, result))
     
     # Summary
     print("\n" + "="*80)
     print("TEST SUMMARY")
     print("="*80)
     
-    passed = sum(1 for r in results if r['status'] == 'PASSED')
-    failed = sum(1 for r in results if r['status'] == 'FAILED')
-    error = sum(1 for r in results if r['status'] == 'ERROR')
-    skipped = sum(1 for r in results if r['status'] == 'SKIPPED')
+    status_counts = Counter(r['status'] for r in results)
+    passed = status_counts['PASSED']
+    failed = status_counts['FAILED']
+    error = status_counts['ERROR']
+    skipped = status_counts['SKIPPED']
     total = len(results)
     
     print(f"\n✅ Passed:  {passed}")
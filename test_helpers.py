@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the PDF test scripts.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Paragraph texts (lower-cased) that mean a subheading was left unmerged
+STANDALONE_SUBHEADINGS = frozenset({
+    'description of the study',
+    'methodological issues',
+    'lessons to consider',
+    'conclusion',
+    'introduction',
+    'background',
+    'discussion',
+    'results',
+    'methods',
+})
+
+
+def _own_number(q: Dict[str, Any]) -> List[Optional[str]]:
+    """The question's own number."""
+    return [q.get('number')]
+
+
+# Where a matching question keeps its numbered items; the first non-empty one wins
+_ITEM_KEYS = ('statements', 'sentence_beginnings', 'paragraphs')
+
+
+def _item_numbers(q: Dict[str, Any]) -> List[Optional[str]]:
+    """Numbers of a matching question's statements / sentence beginnings / paragraphs."""
+    for key in _ITEM_KEYS:
+        items = q.get(key)
+        if items:
+            return [item.get('number') for item in items]
+    return []
+
+
+def _blank_numbers(q: Dict[str, Any]) -> List[Optional[str]]:
+    """Summary blank numbers."""
+    return q.get('blanks') or []
+
+
+# Question type -> function returning the question numbers it covers
+NUMBER_EXTRACTORS = {
+    'single_choice': _own_number,
+    'fill_blank': _own_number,
+    'short_answer': _own_number,
+    'paragraph_matching': _item_numbers,
+    'yes_no_not_given': _item_numbers,
+    'matching_features': _item_numbers,
+    'matching_sentence_endings': _item_numbers,
+    'matching_headings': _item_numbers,
+    'summary_completion': _blank_numbers,
+}
+
+
+def iter_question_numbers(parsed_questions: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Optional[str], str]]:
+    """
+    Yield (number, question type) for every question number in parsed_questions,
+    in order. Numbers are yielded as stored, so missing ones come through as None.
+    """
+    for q in parsed_questions:
+        q_type = q.get('type')
+        extract_numbers = NUMBER_EXTRACTORS.get(q_type)
+        if extract_numbers is None:
+            continue
+        for num in extract_numbers(q):
+            yield num, q_type
@@ -1,58 +1,66 @@
 import glob
 import re
+from string import ascii_uppercase
 
 import fitz
 
-from app import parse_questions
+from app import BlockTable, normalize_whitespace, parse_questions
+
+
+_PASSAGE_START_RE = re.compile(r'below\.', re.IGNORECASE)
+# Where the questions resume after the passage: the first of these
+_QUESTION_KEYWORD_RE = re.compile(
+    r'Choose the correct letter'
+    r'|Complete the sentences'
+    r'|Complete the summary'
+    r'|Do the following statements agree'
+    r'|Matching'
+    r'|List of Headings'
+    r'|\d+\s+What',
+    re.IGNORECASE
+)
 
 
 def extract_text_and_blocks(pdf_path: str):
-    text = ''
-    blocks = []
+    text_chunks = []
+    # Columnar, as app.extract_text_and_blocks() returns it, so parse_questions()
+    # needs no conversion
+    blocks = BlockTable([], [], [], [])
     with fitz.open(pdf_path) as doc:
         for page_index, page in enumerate(doc):
-            text += page.get_text() + "\n"
-            page_dict = page.get_text("dict")
+            # One "dict" pass gives both the page text and the blocks; the
+            # plain-text flags leave images out
+            page_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
             for block in page_dict.get("blocks", []):
                 if "lines" not in block:
                     continue
-                block_text = "".join(
-                    span["text"]
+                line_texts = [
+                    "".join(span["text"] for span in line.get("spans", []))
                     for line in block["lines"]
-                    for span in line.get("spans", [])
-                )
+                ]
+                # As in page.get_text(): every text line followed by a newline
+                text_chunks.extend(line + "\n" for line in line_texts)
+                block_text = "".join(line_texts)
                 if not block_text.strip():
                     continue
-                blocks.append({
-                    "page_index": page_index,
-                    "bbox": block.get("bbox"),
-                    "text": block_text
-                })
-    return text, blocks
+                blocks.text.append(block_text)
+                blocks.text_norm.append(normalize_whitespace(block_text))
+                blocks.page_index.append(page_index)
+                blocks.bbox.append(block.get("bbox"))
+            # Every page, the last included, is followed by a newline
+            text_chunks.append("\n")
+    return ''.join(text_chunks), blocks
 
 
 def split_passage_questions(full_text: str):
     passage = ""
     questions = ""
-    passage_start = re.search(r'below\.', full_text, re.IGNORECASE)
+    passage_start = _PASSAGE_START_RE.search(full_text)
     if passage_start:
         passage_start_index = passage_start.end()
-        question_keywords = [
-            "Choose the correct letter",
-            "Complete the sentences",
-            "Complete the summary",
-            "Do the following statements agree",
-            "Matching",
-            "List of Headings",
-            r'\d+\s+What'
-        ]
-        question_start_index = -1
-        for keyword in question_keywords:
-            search_result = re.search(keyword, full_text[passage_start_index:], re.IGNORECASE)
-            if search_result:
-                absolute = passage_start_index + search_result.start()
-                if question_start_index == -1 or absolute < question_start_index:
-                    question_start_index = absolute
+        # One scan of the alternation finds the earliest keyword
+        question_start = _QUESTION_KEYWORD_RE.search(full_text, passage_start_index)
+        question_start_index = question_start.start() if question_start else -1
         if question_start_index != -1:
             passage = full_text[passage_start_index:question_start_index]
             questions = full_text[question_start_index:]
@@ -66,7 +74,7 @@ def split_passage_questions(full_text: str):
 
 
 def main():
-    candidates = [path for path in glob.glob('pdf/*.pdf') if 'Piraha' in path]
+    candidates = glob.glob('pdf/*Piraha*.pdf')
     if not candidates:
         raise FileNotFoundError("Unable to locate the Pirahã PDF inside pdf/ directory")
     pdf_path = candidates[0]
@@ -81,8 +89,8 @@ def main():
     for question in parsed_questions:
         if question['type'] == 'single_choice':
             print(f"Single Choice {question['number']}. {question['text']}")
-            for idx, option in enumerate(question['options'], start=1):
-                print(f"   {chr(64 + idx)}. {option}")
+            for letter, option in zip(ascii_uppercase, question['options']):
+                print(f"   {letter}. {option}")
         elif question['type'] == 'summary_completion':
             print("Summary Completion:")
             print(question['text'])
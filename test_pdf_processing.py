@@ -3,10 +3,15 @@
 Script to test PDF processing functionality
 This will look for any PDF in common locations and process it
 """
+import io
 import os
 import sys
+import traceback
 from pathlib import Path
 import glob
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 
 # Add current directory to path
 sys.path.insert(0, '/home/runner/work/ILETS-reading-transformer/ILETS-reading-transformer')
@@ -24,13 +29,31 @@ def find_pdfs():
         base_path / 'test_pdfs',
     ]
     
+    # The locations overlap (the repository root holds the others), so each
+    # directory is walked once and the first location to reach a PDF lists it
     pdfs = []
+    walked = set()
     for location in search_locations:
-        if location.exists():
-            pdfs.extend(location.glob('**/*.pdf'))
+        if location.is_dir():
+            pdfs.extend(iter_pdfs(str(location), walked))
     
     return pdfs
 
+def iter_pdfs(directory, walked):
+    """Yield the PDFs under directory, skipping directories already in walked"""
+    walked.add(directory)
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path not in walked:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.pdf'):
+                yield Path(entry.path)
+    # A directory's own PDFs come before those of its subdirectories
+    for subdir in subdirs:
+        yield from iter_pdfs(subdir, walked)
+
 def process_pdf(pdf_path):
     """Process a single PDF file"""
     print(f"\n{'='*70}")
@@ -42,7 +65,7 @@ def process_pdf(pdf_path):
         print("\n1. Extracting text from PDF...")
         full_text, blocks = extract_text_and_blocks(pdf_path)
         print(f"   ✓ Extracted {len(full_text)} characters")
-        print(f"   ✓ Found {len(blocks)} text blocks")
+        print(f"   ✓ Found {len(blocks.text)} text blocks")
         
         # Split passage and questions
         print("\n2. Splitting passage from questions...")
@@ -71,10 +94,7 @@ def process_pdf(pdf_path):
         
         # Display question types
         print("\n5. Question types recognized:")
-        type_counts = {}
-        for q in parsed_questions:
-            q_type = q.get('type', 'unknown')
-            type_counts[q_type] = type_counts.get(q_type, 0) + 1
+        type_counts = Counter(q.get('type', 'unknown') for q in parsed_questions)
         
         question_type_names = {
             'matching_headings': 'Matching Headings',
@@ -124,10 +144,16 @@ def process_pdf(pdf_path):
         
     except Exception as e:
         print(f"\n✗ Error processing PDF: {str(e)}")
-        import traceback
         traceback.print_exc()
         return False
 
+def process_pdf_captured(pdf_path):
+    """Run process_pdf() in a worker, returning (success, stdout text, stderr text)"""
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        success = process_pdf(pdf_path)
+    return success, out.getvalue(), err.getvalue()
+
 def main():
     print("="*70)
     print("IELTS PDF PROCESSOR - Looking for PDF files...")
@@ -150,11 +176,17 @@ def main():
     for i, pdf in enumerate(pdfs, 1):
         print(f"  {i}. {pdf.relative_to(Path('/home/runner/work/ILETS-reading-transformer/ILETS-reading-transformer'))}")
     
-    # Process each PDF
+    # PDFs are independent, so they are processed in worker processes; each
+    # report is captured and written out whole, in the order found
+    sys.stdout.flush()
     success_count = 0
-    for pdf in pdfs:
-        if process_pdf(pdf):
-            success_count += 1
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for success, out, err in executor.map(process_pdf_captured, pdfs):
+            sys.stdout.write(out)
+            sys.stdout.flush()
+            sys.stderr.write(err)
+            if success:
+                success_count += 1
     
     print(f"\n{'='*70}")
     print(f"SUMMARY: Processed {success_count}/{len(pdfs)} PDF(s) successfully")